@@ -1,14 +1,65 @@
-from collections.abc import Generator
+from collections.abc import Callable, Generator, Iterable
+from datetime import datetime
+from typing import NamedTuple
 
 import pytest
 
 from main import Cliente, ContaCorrente, PessoaFisica
 
+# Fixtures de captura que o pytest não permite combinar com capsys
+_CAPTURAS_CONFLITANTES = frozenset({"capfd", "capfdbinary", "capsysbinary"})
+
+
+@pytest.fixture(autouse=True)
+def saida_silenciada(request: pytest.FixtureRequest) -> None:
+    """Fixture automática que captura o stdout de todo teste (mesmo com -s); leia com capsys.readouterr().
+
+    Testes que pedem capfd, capfdbinary ou capsysbinary ficam com a captura que pediram.
+    """
+    if _CAPTURAS_CONFLITANTES.isdisjoint(request.fixturenames):
+        request.getfixturevalue("capsys")
+
+
+@pytest.fixture
+def fixar_agora(monkeypatch: pytest.MonkeyPatch) -> Callable[[datetime], None]:
+    """Fixture que fixa o relógio de main (carimbo das transações e "hoje"); chamar de novo avança o relógio."""
+
+    def _fixar(agora: datetime) -> None:
+        monkeypatch.setattr("main._clock", lambda: agora)
+
+    return _fixar
+
+
+# Nome, nascimento, CPF e endereço do cliente padrão
+_DADOS_CLIENTE_PADRAO = ("João Silva", "01/01/1990", "12345678901", "Rua A, 123 - Centro - SP/SP")
+
+
+@pytest.fixture(scope="session")
+def cliente_padrao_imutavel() -> PessoaFisica:
+    """Fixture que retorna o cliente padrão compartilhado por toda a sessão (somente leitura)."""
+    return PessoaFisica(*_DADOS_CLIENTE_PADRAO)
+
 
 @pytest.fixture
 def cliente_padrao() -> PessoaFisica:
     """Fixture que retorna um cliente padrão para testes."""
-    return PessoaFisica("João Silva", "01/01/1990", "12345678901", "Rua A, 123 - Centro - SP/SP")
+    return PessoaFisica(*_DADOS_CLIENTE_PADRAO)
+
+
+# Nome, nascimento, CPF e endereço do cliente "João" usado nos testes de comportamento e formatação
+_DADOS_CLIENTE_JOAO = ("João", "01/01/1990", "12345678901", "Rua A")
+
+
+@pytest.fixture(scope="module")
+def cliente_joao_imutavel() -> PessoaFisica:
+    """Fixture que retorna o cliente "João" compartilhado pelo módulo (somente leitura)."""
+    return PessoaFisica(*_DADOS_CLIENTE_JOAO)
+
+
+@pytest.fixture
+def cliente_joao() -> PessoaFisica:
+    """Fixture que retorna um cliente "João" novo para testes que usam o cliente como titular."""
+    return PessoaFisica(*_DADOS_CLIENTE_JOAO)
 
 
 @pytest.fixture
@@ -17,12 +68,28 @@ def conta_corrente(cliente_padrao: PessoaFisica) -> ContaCorrente:
     return ContaCorrente(cliente_padrao)
 
 
+@pytest.fixture(scope="module")
+def conta_corrente_imutavel(cliente_padrao_imutavel: PessoaFisica) -> ContaCorrente:
+    """Fixture que retorna uma conta corrente compartilhada pelo módulo (somente leitura)."""
+    return ContaCorrente(cliente_padrao_imutavel)
+
+
 @pytest.fixture
-def conta_com_saldo(cliente_padrao: PessoaFisica) -> ContaCorrente:
-    """Fixture que retorna uma conta corrente com saldo."""
-    conta = ContaCorrente(cliente_padrao)
-    conta.depositar(1000.0)
-    return conta
+def fabrica_conta(cliente_padrao: PessoaFisica) -> Callable[..., ContaCorrente]:
+    """Fixture que retorna uma fábrica de contas correntes com movimentações iniciais.
+
+    Uso: fabrica_conta(depositos=[1000.0], saques=[200.0]) aplica os depósitos e depois os saques.
+    """
+
+    def _criar(depositos: Iterable[float] = (), saques: Iterable[float] = ()) -> ContaCorrente:
+        conta = ContaCorrente(cliente_padrao)
+        for valor in depositos:
+            conta.depositar(valor)
+        for valor in saques:
+            conta.sacar(valor)
+        return conta
+
+    return _criar
 
 
 @pytest.fixture
@@ -31,26 +98,32 @@ def cliente_base() -> Cliente:
     return Cliente("Rua Base, 123 - Centro - SP/SP")
 
 
-@pytest.fixture
-def conta_com_limite_saque(cliente_padrao: PessoaFisica) -> ContaCorrente:
-    """Fixture que retorna uma conta com saldo próximo ao limite de saque."""
-    conta = ContaCorrente(cliente_padrao)
-    conta.depositar(600.0)  # Acima do limite de R$ 500 por saque
-    return conta
+class SistemaClientes(NamedTuple):
+    """Clientes e suas contas, acessíveis por nome ou por desempacotamento (clientes, contas)."""
+
+    clientes: list[PessoaFisica]
+    contas: list[ContaCorrente]
+
+
+# Nome, nascimento, CPF e endereço dos clientes das fixtures compostas
+_DADOS_CLIENTES_DIVERSOS = (
+    ("João Silva", "01/01/1990", "11111111111", "Rua A, 123"),
+    ("Maria Santos", "15/05/1985", "22222222222", "Rua B, 456"),
+    ("Pedro Oliveira", "30/12/1980", "33333333333", "Rua C, 789"),
+    ("Ana Costa", "22/08/1995", "44444444444", "Rua D, 101"),
+    ("Carlos Lima", "10/03/1988", "55555555555", "Rua E, 202"),
+)
 
 
 @pytest.fixture
-def sistema_multiplos_clientes() -> tuple[list[PessoaFisica], list[ContaCorrente]]:
+def sistema_multiplos_clientes() -> SistemaClientes:
     """Fixture que retorna um sistema com múltiplos clientes e contas."""
-    clientes: list[PessoaFisica] = []
-    contas: list[ContaCorrente] = []
-
     # Criar clientes
-    cliente1 = PessoaFisica("João Silva", "01/01/1990", "11111111111", "Rua A, 123")
-    cliente2 = PessoaFisica("Maria Santos", "15/05/1985", "22222222222", "Rua B, 456")
-    cliente3 = PessoaFisica("Pedro Oliveira", "30/12/1980", "33333333333", "Rua C, 789")
+    cliente1 = PessoaFisica(*_DADOS_CLIENTES_DIVERSOS[0])
+    cliente2 = PessoaFisica(*_DADOS_CLIENTES_DIVERSOS[1])
+    cliente3 = PessoaFisica(*_DADOS_CLIENTES_DIVERSOS[2])
 
-    clientes.extend([cliente1, cliente2, cliente3])
+    clientes: list[PessoaFisica] = [cliente1, cliente2, cliente3]
 
     # Criar contas
     conta1 = ContaCorrente(cliente1)
@@ -61,32 +134,15 @@ def sistema_multiplos_clientes() -> tuple[list[PessoaFisica], list[ContaCorrente
     cliente2.adicionar_conta(conta2)
     cliente3.adicionar_conta(conta3)
 
-    contas.extend([conta1, conta2, conta3])
+    contas: list[ContaCorrente] = [conta1, conta2, conta3]
 
-    return clientes, contas
-
-
-@pytest.fixture
-def conta_com_historico(cliente_padrao: PessoaFisica) -> ContaCorrente:
-    """Fixture que retorna uma conta com histórico de movimentações."""
-    conta = ContaCorrente(cliente_padrao)
-    conta.depositar(1000.0)
-    conta.sacar(200.0)
-    conta.depositar(500.0)
-    conta.sacar(100.0)
-    return conta
+    return SistemaClientes(clientes, contas)
 
 
 @pytest.fixture
 def clientes_diversos() -> list[PessoaFisica]:
     """Fixture que retorna uma lista de clientes para testes."""
-    return [
-        PessoaFisica("João Silva", "01/01/1990", "11111111111", "Rua A, 123"),
-        PessoaFisica("Maria Santos", "15/05/1985", "22222222222", "Rua B, 456"),
-        PessoaFisica("Pedro Oliveira", "30/12/1980", "33333333333", "Rua C, 789"),
-        PessoaFisica("Ana Costa", "22/08/1995", "44444444444", "Rua D, 101"),
-        PessoaFisica("Carlos Lima", "10/03/1988", "55555555555", "Rua E, 202"),
-    ]
+    return [PessoaFisica(*dados) for dados in _DADOS_CLIENTES_DIVERSOS]
 
 
 @pytest.fixture
@@ -109,9 +165,9 @@ def sistema_com_multiplas_contas_mesmo_cliente() -> tuple[PessoaFisica, list[Con
 
 
 # Fixture com setup e teardown usando Generator
-@pytest.fixture
+@pytest.fixture(scope="session")
 def ambiente_teste() -> Generator[dict[str, str]]:
-    """Fixture com setup e teardown para ambiente de teste."""
+    """Fixture com setup e teardown executados uma vez por sessão de testes."""
     # Setup
     config_teste = {
         "ambiente": "teste",
@@ -141,9 +197,9 @@ def configuracao_global() -> dict[str, str]:
     }
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def dados_modulo() -> dict[str, int]:
-    """Fixture de escopo de módulo - criada uma vez por arquivo de teste."""
+    """Fixture de dados constantes - criada uma vez para todos os testes."""
     return {
         "limite_saque": 50000,  # R$ 500,00 em centavos
         "limite_saques_diarios": 3,
@@ -196,52 +252,33 @@ def dados_conta(request: pytest.FixtureRequest) -> tuple[str, int]:
         (1000.0, 10),  # Limite R$ 1000, 10 saques
     ]
 )
-def conta_com_limites_personalizados(request: pytest.FixtureRequest, cliente_padrao: PessoaFisica) -> ContaCorrente:
+def conta_com_limites_personalizados(
+    request: pytest.FixtureRequest, cliente_padrao_imutavel: PessoaFisica
+) -> ContaCorrente:
     """Fixture parametrizada com contas com diferentes limites."""
     limite, limite_saques = request.param
-    return ContaCorrente(cliente_padrao, limite=limite, limite_saques=limite_saques)
+    return ContaCorrente(cliente_padrao_imutavel, limite=limite, limite_saques=limite_saques)
 
 
-# Fixtures para casos específicos
-@pytest.fixture
-def conta_zerada(cliente_padrao: PessoaFisica) -> ContaCorrente:
-    """Fixture que retorna uma conta corrente sem saldo."""
-    return ContaCorrente(cliente_padrao)
-
-
-@pytest.fixture
-def conta_com_saldo_limite(cliente_padrao: PessoaFisica) -> ContaCorrente:
-    """Fixture que retorna uma conta com saldo exatamente no limite de saque."""
-    conta = ContaCorrente(cliente_padrao)
-    conta.depositar(500.0)  # Exatamente o limite de saque
-    return conta
-
-
-@pytest.fixture
-def conta_com_muito_saldo(cliente_padrao: PessoaFisica) -> ContaCorrente:
-    """Fixture que retorna uma conta com muito saldo."""
-    conta = ContaCorrente(cliente_padrao)
-    conta.depositar(10000.0)  # R$ 10.000,00
-    return conta
+# Fixtures para testes de integração
+# Dados de teste mais realistas, alocados uma única vez na importação do módulo
+_DADOS_CLIENTES = (
+    ("João Silva Santos", "01/01/1985", "12345678901", "Rua das Flores, 123 - Centro - São Paulo/SP"),
+    ("Maria Oliveira Costa", "15/05/1990", "98765432101", "Av. Paulista, 456 - Bela Vista - São Paulo/SP"),
+    ("Pedro Santos Lima", "22/12/1975", "11122233344", "Rua Augusta, 789 - Consolação - São Paulo/SP"),
+    ("Ana Paula Silva", "30/08/1988", "55566677788", "Av. Faria Lima, 321 - Itaim Bibi - São Paulo/SP"),
+    ("Carlos Eduardo Souza", "10/03/1992", "99988877766", "Rua Oscar Freire, 654 - Jardins - São Paulo/SP"),
+)
+_SALDOS_INICIAIS = (1000.0, 2500.0, 500.0, 3000.0, 1500.0)
 
 
-# Fixtures para testes de integração
 @pytest.fixture
 def sistema_bancario_completo() -> tuple[list[PessoaFisica], list[ContaCorrente]]:
     """Fixture que retorna um sistema bancário completo para testes de integração."""
     clientes: list[PessoaFisica] = []
     contas: list[ContaCorrente] = []
 
-    # Dados de teste mais realistas
-    dados_clientes = [
-        ("João Silva Santos", "01/01/1985", "12345678901", "Rua das Flores, 123 - Centro - São Paulo/SP"),
-        ("Maria Oliveira Costa", "15/05/1990", "98765432101", "Av. Paulista, 456 - Bela Vista - São Paulo/SP"),
-        ("Pedro Santos Lima", "22/12/1975", "11122233344", "Rua Augusta, 789 - Consolação - São Paulo/SP"),
-        ("Ana Paula Silva", "30/08/1988", "55566677788", "Av. Faria Lima, 321 - Itaim Bibi - São Paulo/SP"),
-        ("Carlos Eduardo Souza", "10/03/1992", "99988877766", "Rua Oscar Freire, 654 - Jardins - São Paulo/SP"),
-    ]
-
-    for nome, data_nasc, cpf, endereco in dados_clientes:
+    for (nome, data_nasc, cpf, endereco), saldo_inicial in zip(_DADOS_CLIENTES, _SALDOS_INICIAIS, strict=True):
         # Criar cliente
         cliente = PessoaFisica(nome, data_nasc, cpf, endereco)
         clientes.append(cliente)
@@ -252,27 +289,41 @@ def sistema_bancario_completo() -> tuple[list[PessoaFisica], list[ContaCorrente]
         cliente.adicionar_conta(conta)
 
         # Adicionar algum saldo inicial variado
-        saldos_iniciais = [1000.0, 2500.0, 500.0, 3000.0, 1500.0]
-        conta.depositar(saldos_iniciais[len(clientes) - 1])
+        conta.depositar(saldo_inicial)
 
     return clientes, contas
 
 
 # Fixtures para testes de performance
-@pytest.fixture
-def muitos_clientes() -> list[PessoaFisica]:
-    """Fixture que cria muitos clientes para testes de performance."""
-    clientes = []
+def _criar_muitos_clientes(quantidade: int) -> list[PessoaFisica]:
+    """Cria clientes de teste numerados, com CPF sequencial com zeros à esquerda."""
+    return [
+        PessoaFisica(
+            f"Cliente Teste {i:03d}",
+            "01/01/1990",
+            str(i).zfill(11),
+            f"Rua Teste {i}, {i * 10} - Bairro {i % 10} - Cidade/SP",
+        )
+        for i in range(quantidade)
+    ]
 
-    for i in range(100):
-        cpf = f"{i:011d}"  # CPF sequencial com zeros à esquerda
-        nome = f"Cliente Teste {i:03d}"
-        endereco = f"Rua Teste {i}, {i*10} - Bairro {i%10} - Cidade/SP"
 
-        cliente = PessoaFisica(nome, "01/01/1990", cpf, endereco)
-        clientes.append(cliente)
+def _quantidade_muitos_clientes(config: pytest.Config) -> int:
+    """Com --opt-level abaixo de 2 cria apenas 5 clientes, para execuções rápidas durante o desenvolvimento."""
+    return 100 if config.getoption("--opt-level") >= 2 else 5
+
+
+# Construtores determinísticos ficam em escopo de sessão: são montados uma única vez
+@pytest.fixture(scope="session")
+def muitos_clientes(pytestconfig: pytest.Config) -> tuple[PessoaFisica, ...]:
+    """Fixture que cria muitos clientes (somente leitura) para testes de performance."""
+    return tuple(_criar_muitos_clientes(_quantidade_muitos_clientes(pytestconfig)))
 
-    return clientes
+
+@pytest.fixture
+def muitos_clientes_mut(pytestconfig: pytest.Config) -> list[PessoaFisica]:
+    """Fixture que cria clientes novos para testes que alteram estado (construir sai mais barato que deepcopy)."""
+    return _criar_muitos_clientes(_quantidade_muitos_clientes(pytestconfig))
 
 
 # Fixtures para casos de erro
@@ -284,11 +335,29 @@ def cliente_sem_contas(cliente_padrao: PessoaFisica) -> PessoaFisica:
     return cliente_padrao
 
 
-# Configuração para marcadores de teste
-def pytest_configure(config: pytest.Config) -> None:
-    """Configuração de marcadores customizados para pytest."""
-    config.addinivalue_line("markers", "slow: marca testes como lentos")
-    config.addinivalue_line("markers", "integration: marca testes de integração")
-    config.addinivalue_line("markers", "unit: marca testes unitários")
-    config.addinivalue_line("markers", "performance: marca testes de performance")
-    config.addinivalue_line("markers", "edge_case: marca testes de casos extremos")
+# Opções de linha de comando
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Registra opções customizadas de linha de comando para pytest."""
+    parser.addoption(
+        "--opt-level",
+        type=int,
+        default=3,
+        help="nível de otimização dos testes: abaixo de 2 reduz as fixtures mais pesadas",
+    )
+    parser.addoption("--runslow", action="store_true", default=False, help="executa também os testes lentos")
+
+
+# Fixtures que tornam um teste lento só por serem requisitadas
+_FIXTURES_LENTAS = frozenset({"muitos_clientes", "muitos_clientes_mut", "sistema_bancario_completo"})
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Pula testes lentos (marcados como slow ou que usam fixtures pesadas) sem a opção --runslow."""
+    if config.getoption("--runslow"):
+        return
+
+    pular_lento = pytest.mark.skip(reason="teste lento: use --runslow para executar")
+    for item in items:
+        nomes_fixtures = getattr(item, "fixturenames", ())
+        if "slow" in item.keywords or not _FIXTURES_LENTAS.isdisjoint(nomes_fixtures):
+            item.add_marker(pular_lento)
@@ -1,52 +1,130 @@
+import re
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from datetime import datetime
+from typing import ClassVar
+
+# Tabela de str.translate que remove os caracteres ASCII que não são dígitos (pontos, traços, espaços...)
+_TABELA_SOMENTE_DIGITOS = str.maketrans("", "", "".join(chr(c) for c in range(128) if not chr(c).isdigit()))
+
+# CPF com exatamente 11 dígitos, aceitando qualquer formatação entre eles
+_CPF_RE = re.compile(r"\D*(?:\d\D*){11}")
+
+
+def _normalizar_cpf(cpf: str) -> str:
+    """Remove a formatação do CPF e retorna apenas os dígitos."""
+    numeros = cpf.translate(_TABELA_SOMENTE_DIGITOS)
+    if numeros.isdigit():
+        return numeros
+    # Restaram caracteres não ASCII: filtra caractere a caractere
+    return "".join(filter(str.isdigit, numeros))
+
+
+# Casas decimais "00".."99" já formatadas, indexadas pelos centavos
+_CENTAVOS_STR = tuple(f"{i:02d}" for i in range(100))
+
+# Relógio usado para carimbar as transações e para saber qual é "hoje"; substituível em testes e em cargas em lote
+_clock = datetime.now
+
+
+def _reais_para_centavos(valor: float) -> int:
+    """Converte um valor em reais para centavos, arredondando (int(0.29 * 100) daria 28)."""
+    return round(valor * 100)
+
+
+def _parse_valor_centavos(texto: str) -> int | None:
+    """Converte o valor digitado ("10", "10.5", "10,50") direto para centavos, sem passar por float."""
+    texto = texto.strip().replace(",", ".")
+    negativo = texto.startswith("-")
+    if negativo or texto.startswith("+"):
+        texto = texto[1:]
+
+    inteiros, _, decimais = texto.partition(".")
+    if not (inteiros + decimais).isdecimal():
+        return None
+
+    # Completa/trunca as casas decimais para exatamente dois dígitos
+    centavos = int(inteiros or "0") * 100 + int((decimais + "00")[:2])
+    return -centavos if negativo else centavos
 
 
 class Cliente:
     """Classe que representa um cliente do banco."""
 
+    __slots__ = ("contas", "endereco")
+
+    # Limite de transações por conta e por dia, comum a todos os clientes
+    _LIMITE_TRANSACOES_DIARIAS: ClassVar[int] = 10
+
     def __init__(self, endereco: str) -> None:
         self.endereco: str = endereco
         self.contas: list[Conta] = []
 
     def realizar_transacao(self, conta: "Conta", transacao: "Transacao") -> None:
         """Realiza uma transação em uma conta específica."""
-        if len(conta.historico.transacoes) >= 10:
-            print("❌ Erro: Limite de 10 transações por dia atingido!")
+        if not self.pode_realizar_transacao(conta):
             return
 
         transacao.registrar(conta)
 
+    def pode_realizar_transacao(self, conta: "Conta") -> bool:
+        """Verifica se a conta ainda não atingiu o limite diário de transações."""
+        if conta.historico.quantidade_transacoes_do_dia >= self._LIMITE_TRANSACOES_DIARIAS:
+            print(f"❌ Erro: Limite de {self._LIMITE_TRANSACOES_DIARIAS} transações por dia atingido!")
+            return False
+        return True
+
     def adicionar_conta(self, conta: "Conta") -> None:
         """Adiciona uma conta à lista de contas do cliente."""
         self.contas.append(conta)
 
+    def titular_nome(self) -> str:
+        """Retorna o nome exibido como titular das contas do cliente."""
+        return "Cliente"
+
 
 class PessoaFisica(Cliente):
     """Classe que representa uma pessoa física como cliente do banco."""
 
+    __slots__ = ("_cpf_formatado", "cpf", "data_nascimento", "nome")
+
     def __init__(self, nome: str, data_nascimento: str, cpf: str, endereco: str) -> None:
         super().__init__(endereco)
         self.nome: str = nome
         self.data_nascimento: str = data_nascimento
         self.cpf: str = self._formatar_cpf(cpf)
+        # O CPF não muda após o cadastro: a versão de exibição é montada uma única vez
+        self._cpf_formatado: str = f"{self.cpf[:3]}.{self.cpf[3:6]}.{self.cpf[6:9]}-{self.cpf[9:]}"
 
     def _formatar_cpf(self, cpf: str) -> str:
         """Remove formatação do CPF e armazena apenas números."""
-        return "".join(filter(str.isdigit, cpf))
+        return _normalizar_cpf(cpf)
 
     def get_cpf_formatado(self) -> str:
         """Retorna CPF formatado para exibição."""
-        cpf = self.cpf
-        return f"{cpf[:3]}.{cpf[3:6]}.{cpf[6:9]}-{cpf[9:]}"
+        return self._cpf_formatado
+
+    def titular_nome(self) -> str:
+        """Retorna o nome da pessoa física como titular."""
+        return self.nome
 
     def __str__(self) -> str:
-        return f"{self.nome} - CPF: {self.get_cpf_formatado()}"
+        return f"{self.nome} - CPF: {self._cpf_formatado}"
 
 
 class Conta:
     """Classe base que representa uma conta bancária."""
 
+    __slots__ = (
+        "_agencia",
+        "_cliente",
+        "_historico",
+        "_numero",
+        "_saldo_centavos",
+        "_saldo_formatado",
+        "_verbose",
+    )
+
     _contador_contas: int = 1
 
     def __init__(self, cliente: Cliente, numero: int | None = None) -> None:
@@ -55,6 +133,10 @@ class Conta:
         self._agencia: str = "0001"
         self._cliente: Cliente = cliente
         self._historico: Historico = Historico()
+        # Mensagens de saque/depósito no terminal; desligadas para uso programático em lote
+        self._verbose: bool = True
+        # Último saldo formatado, como (saldo em centavos, texto), reaproveitado enquanto o saldo não muda
+        self._saldo_formatado: tuple[int, str] = (0, self._formatar_moeda(0))
 
         if numero is None:
             Conta._contador_contas += 1
@@ -89,157 +171,250 @@ class Conta:
         """Retorna o histórico."""
         return self._historico
 
+    # sacar e depositar convertem reais para centavos; subclasses personalizam sacar_centavos e depositar_centavos
     def sacar(self, valor: float) -> bool:
         """Realiza saque da conta."""
-        if valor <= 0:
-            print("❌ Erro: O valor do saque deve ser positivo!")
-            return False
+        return self.sacar_centavos(_reais_para_centavos(valor))
+
+    def depositar(self, valor: float) -> bool:
+        """Realiza depósito na conta."""
+        return self.depositar_centavos(_reais_para_centavos(valor))
 
-        valor_centavos = int(valor * 100)
+    def sacar_centavos(self, valor_centavos: int, dia: int | None = None) -> bool:
+        """Realiza saque de um valor já convertido para centavos (dia: ordinal da data do saque)."""
+        if valor_centavos <= 0:
+            if self._verbose:
+                print("❌ Erro: O valor do saque deve ser positivo!")
+            return False
 
         if valor_centavos > self._saldo_centavos:
-            print("❌ Erro: Saldo insuficiente para realizar o saque!")
-            print(f"💳 Saldo atual: {self._formatar_moeda(self._saldo_centavos)}")
+            if self._verbose:
+                print(
+                    f"❌ Erro: Saldo insuficiente para realizar o saque!\n💳 Saldo atual: {self.get_saldo_formatado()}"
+                )
             return False
 
         self._saldo_centavos -= valor_centavos
-        print("✅ Saque realizado com sucesso!")
-        print(f"💸 Valor sacado: {self._formatar_moeda(valor_centavos)}")
-        print(f"💳 Saldo atual: {self._formatar_moeda(self._saldo_centavos)}")
+        if self._verbose:
+            print(
+                "✅ Saque realizado com sucesso!\n"
+                f"💸 Valor sacado: {self._formatar_moeda(valor_centavos)}\n"
+                f"💳 Saldo atual: {self.get_saldo_formatado()}"
+            )
         return True
 
-    def depositar(self, valor: float) -> bool:
-        """Realiza depósito na conta."""
-        if valor <= 0:
-            print("❌ Erro: O valor do depósito deve ser positivo!")
+    def depositar_centavos(self, valor_centavos: int) -> bool:
+        """Realiza depósito de um valor já convertido para centavos."""
+        if valor_centavos <= 0:
+            if self._verbose:
+                print("❌ Erro: O valor do depósito deve ser positivo!")
             return False
 
-        valor_centavos = int(valor * 100)
         self._saldo_centavos += valor_centavos
 
-        print("✅ Depósito realizado com sucesso!")
-        print(f"💰 Valor depositado: {self._formatar_moeda(valor_centavos)}")
-        print(f"💳 Saldo atual: {self._formatar_moeda(self._saldo_centavos)}")
+        if self._verbose:
+            print(
+                "✅ Depósito realizado com sucesso!\n"
+                f"💰 Valor depositado: {self._formatar_moeda(valor_centavos)}\n"
+                f"💳 Saldo atual: {self.get_saldo_formatado()}"
+            )
         return True
 
-    def _formatar_moeda(self, centavos: int) -> str:
+    def set_verbose(self, verbose: bool) -> None:
+        """Liga ou desliga as mensagens de saque e depósito desta conta."""
+        self._verbose = verbose
+
+    @staticmethod
+    def _formatar_moeda(centavos: int) -> str:
         """Formata centavos para exibição em moeda brasileira."""
-        reais = centavos // 100
-        cents = centavos % 100
-        return f"R$ {reais}.{cents:02d}"
+        reais, cents = divmod(centavos, 100)
+        return f"R$ {reais}.{_CENTAVOS_STR[cents]}"
 
     def get_saldo_formatado(self) -> str:
         """Retorna o saldo atual formatado."""
-        return self._formatar_moeda(self._saldo_centavos)
+        centavos, formatado = self._saldo_formatado
+        if centavos != self._saldo_centavos:
+            formatado = self._formatar_moeda(self._saldo_centavos)
+            self._saldo_formatado = (self._saldo_centavos, formatado)
+        return formatado
 
 
 class ContaCorrente(Conta):
     """Classe que representa uma conta corrente com limites específicos."""
 
+    __slots__ = (
+        "_limite_centavos",
+        "_limite_formatado",
+        "_limite_saques",
+        "_saques_por_dia",
+    )
+
     def __init__(
         self, cliente: Cliente, numero: int | None = None, limite: float = 500.0, limite_saques: int = 3
     ) -> None:
         super().__init__(cliente, numero)
-        self._limite_centavos: int = int(limite * 100)
+        self._limite_centavos: int = _reais_para_centavos(limite)
+        # O limite não muda depois da abertura: formatado uma vez para as mensagens de erro
+        self._limite_formatado: str = self._formatar_moeda(self._limite_centavos)
         self._limite_saques: int = limite_saques
-        self._saques_realizados_hoje: int = 0
-        self._data_ultimo_saque: str = ""
+        # Saques realizados por dia (ordinal): o limite vale para o dia do próprio saque, mesmo retroativo
+        self._saques_por_dia: dict[int, int] = {}
 
-    def sacar(self, valor: float) -> bool:
+    def sacar_centavos(self, valor_centavos: int, dia: int | None = None) -> bool:
         """Realiza saque com validações específicas da conta corrente."""
-        if valor <= 0:
-            print("❌ Erro: O valor do saque deve ser positivo!")
+        if valor_centavos <= 0:
+            if self._verbose:
+                print("❌ Erro: O valor do saque deve ser positivo!")
             return False
 
-        valor_centavos = int(valor * 100)
-        data_hoje = datetime.now().strftime("%d/%m/%Y")
-
-        # Reset contador se mudou o dia
-        if self._data_ultimo_saque != data_hoje:
-            self._saques_realizados_hoje = 0
-            self._data_ultimo_saque = data_hoje
+        if dia is None:
+            dia = _clock().toordinal()
+        saques_do_dia = self._saques_por_dia.get(dia, 0)
 
         # Validação de limite de saques diários
-        if self._saques_realizados_hoje >= self._limite_saques:
-            print(f"❌ Erro: Limite de {self._limite_saques} saques diários atingido!")
+        if saques_do_dia >= self._limite_saques:
+            if self._verbose:
+                print(f"❌ Erro: Limite de {self._limite_saques} saques diários atingido!")
             return False
 
         # Validação de limite por saque
         if valor_centavos > self._limite_centavos:
-            print(f"❌ Erro: Valor excede o limite máximo de {self._formatar_moeda(self._limite_centavos)} por saque!")
+            if self._verbose:
+                print(f"❌ Erro: Valor excede o limite máximo de {self._limite_formatado} por saque!")
             return False
 
         # Validação de saldo
         if valor_centavos > self._saldo_centavos:
-            print("❌ Erro: Saldo insuficiente para realizar o saque!")
-            print(f"💳 Saldo atual: {self._formatar_moeda(self._saldo_centavos)}")
+            if self._verbose:
+                print(
+                    f"❌ Erro: Saldo insuficiente para realizar o saque!\n💳 Saldo atual: {self.get_saldo_formatado()}"
+                )
             return False
 
         # Realiza o saque
         self._saldo_centavos -= valor_centavos
-        self._saques_realizados_hoje += 1
-
-        print("✅ Saque realizado com sucesso!")
-        print(f"💸 Valor sacado: {self._formatar_moeda(valor_centavos)}")
-        print(f"💳 Saldo atual: {self._formatar_moeda(self._saldo_centavos)}")
-        print(f"📊 Saques restantes hoje: {self._limite_saques - self._saques_realizados_hoje}")
+        saques_do_dia += 1
+        self._saques_por_dia[dia] = saques_do_dia
+
+        if self._verbose:
+            print(
+                "✅ Saque realizado com sucesso!\n"
+                f"💸 Valor sacado: {self._formatar_moeda(valor_centavos)}\n"
+                f"💳 Saldo atual: {self.get_saldo_formatado()}\n"
+                f"📊 Saques restantes hoje: {self._limite_saques - saques_do_dia}"
+            )
         return True
 
     def __str__(self) -> str:
         return f"""\
             Agência:\t{self.agencia}
             C/C:\t\t{self.numero}
-            Titular:\t{self.cliente.nome if isinstance(self.cliente, PessoaFisica) else 'Cliente'}
+            Titular:\t{self.cliente.titular_nome()}
         """
 
 
 class Historico:
     """Classe que representa o histórico de transações de uma conta."""
 
+    __slots__ = ("_contador_dia", "_dia_ordinal", "_por_tipo", "_transacoes")
+
     def __init__(self) -> None:
         self._transacoes: list[Transacao] = []
+        # Índice por tipo (nome da classe em minúsculas) para relatórios filtrados sem varrer todo o histórico
+        self._por_tipo: dict[str, list[Transacao]] = {}
+        # Contador de transações do dia (ordinal) da última transação registrada
+        self._dia_ordinal: int = 0
+        self._contador_dia: int = 0
 
     @property
     def transacoes(self) -> list["Transacao"]:
         """Retorna a lista de transações."""
         return self._transacoes
 
+    @property
+    def quantidade_transacoes_do_dia(self) -> int:
+        """Retorna quantas transações foram registradas no dia atual."""
+        return self._contador_dia if self._dia_ordinal == _clock().toordinal() else 0
+
     def adicionar_transacao(self, transacao: "Transacao") -> None:
         """Adiciona uma transação ao histórico."""
         self._transacoes.append(transacao)
+        self._por_tipo.setdefault(transacao._TIPO, []).append(transacao)
+
+        # Transações com data anterior à da última registrada não mexem no contador do dia mais recente
+        dia = transacao.data_hora.toordinal()
+        if dia > self._dia_ordinal:
+            self._dia_ordinal = dia
+            self._contador_dia = 0
+        if dia == self._dia_ordinal:
+            self._contador_dia += 1
 
     def gerar_relatorio(self, tipo_transacao: str | None = None) -> str:
         """Gera relatório das transações."""
         if not self._transacoes:
             return "📝 Nenhuma movimentação registrada."
 
-        relatorio = []
-        for transacao in self._transacoes:
-            if tipo_transacao is None or transacao.__class__.__name__.lower() == tipo_transacao.lower():
-                relatorio.append(
-                    f"{transacao.data_hora.strftime('%d/%m/%Y %H:%M:%S')} - "
-                    f"{transacao.__class__.__name__}: R$ {transacao.valor:.2f}"
-                )
+        transacoes = self._transacoes if tipo_transacao is None else self._por_tipo.get(tipo_transacao.lower(), [])
+
+        # strftime uma vez por segundo: transações feitas em sequência reaproveitam o mesmo texto
+        carimbos: dict[datetime, str] = {}
+        linhas = []
+        for transacao in transacoes:
+            segundo = transacao.data_hora.replace(microsecond=0)
+            carimbo = carimbos.get(segundo)
+            if carimbo is None:
+                carimbo = carimbos[segundo] = segundo.strftime("%d/%m/%Y %H:%M:%S")
+            linhas.append(f"{carimbo} - {type(transacao).__name__}: {Conta._formatar_moeda(transacao.valor_centavos)}")
 
-        return "\n".join(relatorio) if relatorio else f"📝 Nenhuma transação do tipo '{tipo_transacao}' encontrada."
+        return "\n".join(linhas) or f"📝 Nenhuma transação do tipo '{tipo_transacao}' encontrada."
 
     def transacoes_do_dia(self) -> list["Transacao"]:
         """Retorna transações do dia atual."""
-        hoje = datetime.now().date()
-        return [t for t in self._transacoes if t.data_hora.date() == hoje]
+        hoje = _clock().toordinal()
+        return [t for t in self._transacoes if t.data_hora.toordinal() == hoje]
 
 
 class Transacao(ABC):
     """Classe abstrata base para transações."""
 
-    def __init__(self, valor: float) -> None:
-        self._valor: float = valor
-        self.data_hora: datetime = datetime.now()
+    __slots__ = ("_valor_centavos", "data_hora")
+
+    _DESCRICAO: ClassVar[str] = "transação"
+    # Chave do tipo no índice do Historico ("saque", "deposito"), calculada uma vez por classe
+    _TIPO: ClassVar[str] = "transacao"
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._TIPO = cls.__name__.lower()
+
+    def __init__(
+        self, valor: float | None = None, data_hora: datetime | None = None, *, valor_centavos: int | None = None
+    ) -> None:
+        # valor_centavos (já em centavos, sem passar por float) tem precedência sobre valor em reais
+        if valor_centavos is None:
+            if valor is None:
+                raise TypeError("Informe valor ou valor_centavos")
+            valor_centavos = _reais_para_centavos(valor)
+        self._valor_centavos: int = valor_centavos
+        self.data_hora: datetime = data_hora if data_hora is not None else _clock()
 
     @property
     def valor(self) -> float:
-        """Valor da transação."""
-        return self._valor
+        """Valor da transação em reais, arredondado para centavos."""
+        return self._valor_centavos / 100
+
+    @property
+    def valor_centavos(self) -> int:
+        """Valor da transação em centavos."""
+        return self._valor_centavos
+
+    @classmethod
+    def pode_aplicar(cls, valor_centavos: int) -> bool:
+        """Valida o valor (em centavos) antes de criar a transação, sem alterar nenhuma conta."""
+        if valor_centavos <= 0:
+            print(f"❌ Erro: O valor do {cls._DESCRICAO} deve ser positivo!")
+            return False
+        return True
 
     @abstractmethod
     def registrar(self, conta: Conta) -> None:
@@ -250,12 +425,19 @@ class Transacao(ABC):
 class Saque(Transacao):
     """Classe que representa uma transação de saque."""
 
-    def __init__(self, valor: float) -> None:
-        super().__init__(valor)
+    __slots__ = ()
+
+    _DESCRICAO = "saque"
+
+    def __init__(
+        self, valor: float | None = None, data_hora: datetime | None = None, *, valor_centavos: int | None = None
+    ) -> None:
+        super().__init__(valor, data_hora, valor_centavos=valor_centavos)
 
     def registrar(self, conta: Conta) -> None:
         """Registra o saque na conta."""
-        sucesso = conta.sacar(self.valor)
+        # O dia do saque vem da própria transação, sem consultar o relógio de novo
+        sucesso = conta.sacar_centavos(self._valor_centavos, self.data_hora.toordinal())
         if sucesso:
             conta.historico.adicionar_transacao(self)
 
@@ -263,38 +445,50 @@ class Saque(Transacao):
 class Deposito(Transacao):
     """Classe que representa uma transação de depósito."""
 
-    def __init__(self, valor: float) -> None:
-        super().__init__(valor)
+    __slots__ = ()
+
+    _DESCRICAO = "depósito"
+
+    def __init__(
+        self, valor: float | None = None, data_hora: datetime | None = None, *, valor_centavos: int | None = None
+    ) -> None:
+        super().__init__(valor, data_hora, valor_centavos=valor_centavos)
 
     def registrar(self, conta: Conta) -> None:
         """Registra o depósito na conta."""
-        sucesso = conta.depositar(self.valor)
+        sucesso = conta.depositar_centavos(self._valor_centavos)
         if sucesso:
             conta.historico.adicionar_transacao(self)
 
 
+# Menu principal montado uma única vez e exibido com uma só escrita no terminal
+_MENU = "\n".join(
+    [
+        "\n" + "=" * 60,
+        "🏦 SISTEMA BANCÁRIO - VERSÃO 3.0 (CLASSES)",
+        "=" * 60,
+        "1️⃣  Criar Usuário",
+        "2️⃣  Criar Conta Corrente",
+        "3️⃣  Depositar",
+        "4️⃣  Sacar",
+        "5️⃣  Visualizar Extrato",
+        "6️⃣  Listar Usuários",
+        "7️⃣  Listar Contas",
+        "8️⃣  Relatório de Transações",
+        "9️⃣  Sair",
+        "=" * 60,
+    ]
+)
+
+
 def exibir_menu() -> None:
     """Exibe o menu principal do sistema."""
-    print("\n" + "=" * 60)
-    print("🏦 SISTEMA BANCÁRIO - VERSÃO 3.0 (CLASSES)")
-    print("=" * 60)
-    print("1️⃣  Criar Usuário")
-    print("2️⃣  Criar Conta Corrente")
-    print("3️⃣  Depositar")
-    print("4️⃣  Sacar")
-    print("5️⃣  Visualizar Extrato")
-    print("6️⃣  Listar Usuários")
-    print("7️⃣  Listar Contas")
-    print("8️⃣  Relatório de Transações")
-    print("9️⃣  Sair")
-    print("=" * 60)
-
-
-def filtrar_cliente(cpf: str, clientes: list[PessoaFisica]) -> PessoaFisica | None:
-    """Filtra cliente por CPF."""
-    cpf_numeros = "".join(filter(str.isdigit, cpf))
-    clientes_filtrados = [cliente for cliente in clientes if cliente.cpf == cpf_numeros]
-    return clientes_filtrados[0] if clientes_filtrados else None
+    print(_MENU)
+
+
+def filtrar_cliente(cpf: str, clientes: dict[str, PessoaFisica]) -> PessoaFisica | None:
+    """Busca cliente pelo CPF no índice de clientes (chave: CPF apenas com números)."""
+    return clientes.get(_normalizar_cpf(cpf))
 
 
 def recuperar_conta_cliente(cliente: Cliente) -> Conta | None:
@@ -323,7 +517,7 @@ def recuperar_conta_cliente(cliente: Cliente) -> Conta | None:
         return None
 
 
-def processar_deposito(clientes: list[PessoaFisica]) -> None:
+def processar_deposito(clientes: dict[str, PessoaFisica]) -> None:
     """Função para realizar depósito."""
     cpf = input("Informe o CPF do cliente: ")
     cliente = filtrar_cliente(cpf, clientes)
@@ -332,9 +526,8 @@ def processar_deposito(clientes: list[PessoaFisica]) -> None:
         print("\n❌ Cliente não encontrado!")
         return
 
-    try:
-        valor = float(input("Informe o valor do depósito: "))
-    except ValueError:
+    valor_centavos = _parse_valor_centavos(input("Informe o valor do depósito: "))
+    if valor_centavos is None:
         print("❌ Valor inválido!")
         return
 
@@ -342,11 +535,15 @@ def processar_deposito(clientes: list[PessoaFisica]) -> None:
     if not conta:
         return
 
-    transacao = Deposito(valor)
-    cliente.realizar_transacao(conta, transacao)
+    # Rejeita valor inválido antes de criar a transação (e de consultar o relógio); o limite diário fica com
+    # realizar_transacao
+    if not Deposito.pode_aplicar(valor_centavos):
+        return
 
+    cliente.realizar_transacao(conta, Deposito(valor_centavos=valor_centavos))
 
-def processar_saque(clientes: list[PessoaFisica]) -> None:
+
+def processar_saque(clientes: dict[str, PessoaFisica]) -> None:
     """Função para realizar saque."""
     cpf = input("Informe o CPF do cliente: ")
     cliente = filtrar_cliente(cpf, clientes)
@@ -355,9 +552,8 @@ def processar_saque(clientes: list[PessoaFisica]) -> None:
         print("\n❌ Cliente não encontrado!")
         return
 
-    try:
-        valor = float(input("Informe o valor do saque: "))
-    except ValueError:
+    valor_centavos = _parse_valor_centavos(input("Informe o valor do saque: "))
+    if valor_centavos is None:
         print("❌ Valor inválido!")
         return
 
@@ -365,11 +561,15 @@ def processar_saque(clientes: list[PessoaFisica]) -> None:
     if not conta:
         return
 
-    transacao = Saque(valor)
-    cliente.realizar_transacao(conta, transacao)
+    # Rejeita valor inválido antes de criar a transação (e de consultar o relógio); o limite diário fica com
+    # realizar_transacao
+    if not Saque.pode_aplicar(valor_centavos):
+        return
+
+    cliente.realizar_transacao(conta, Saque(valor_centavos=valor_centavos))
 
 
-def exibir_extrato(clientes: list[PessoaFisica]) -> None:
+def exibir_extrato(clientes: dict[str, PessoaFisica]) -> None:
     """Função para exibir extrato."""
     cpf = input("Informe o CPF do cliente: ")
     cliente = filtrar_cliente(cpf, clientes)
@@ -382,18 +582,22 @@ def exibir_extrato(clientes: list[PessoaFisica]) -> None:
     if not conta:
         return
 
-    print("\n" + "=" * 100)
-    print("EXTRATO".center(100))
-    print("=" * 100)
-
-    transacoes = conta.historico.gerar_relatorio()
-    print(transacoes)
-
-    print(f"\nSaldo:\t\tR$ {conta.saldo:.2f}")
-    print("=" * 100)
-
-
-def processar_criacao_usuario(clientes: list[PessoaFisica]) -> None:
+    separador = "=" * 100
+    print(
+        "\n".join(
+            [
+                "\n" + separador,
+                "EXTRATO".center(100),
+                separador,
+                conta.historico.gerar_relatorio(),
+                f"\nSaldo:\t\tR$ {conta.saldo:.2f}",
+                separador,
+            ]
+        )
+    )
+
+
+def processar_criacao_usuario(clientes: dict[str, PessoaFisica]) -> None:
     """Processa criação de novo usuário."""
     print("\n👤 CRIAR NOVO USUÁRIO")
     nome = input("📝 Nome completo: ").strip()
@@ -420,13 +624,13 @@ def processar_criacao_usuario(clientes: list[PessoaFisica]) -> None:
 
     if nome and data_nascimento and cpf:
         cliente = PessoaFisica(nome=nome, data_nascimento=data_nascimento, cpf=cpf, endereco=endereco)
-        clientes.append(cliente)
+        clientes[cliente.cpf] = cliente
         print(f"✅ Usuário {nome} criado com sucesso!")
     else:
         print("❌ Erro: Todos os campos são obrigatórios!")
 
 
-def processar_criacao_conta(clientes: list[PessoaFisica], contas: list[Conta]) -> None:
+def processar_criacao_conta(clientes: dict[str, PessoaFisica], contas: list[Conta]) -> None:
     """Processa criação de conta corrente."""
     print("\n🏦 CRIAR CONTA CORRENTE")
     cpf = input("📄 CPF do usuário: ").strip()
@@ -455,22 +659,25 @@ def listar_contas(contas: list[Conta]) -> None:
         print("\n📝 Nenhuma conta cadastrada.")
         return
 
-    print("\n🏦 CONTAS CADASTRADAS:")
-    print("-" * 100)
-    for conta in contas:
-        linha = f"Agência: {conta.agencia} | Conta: {conta.numero} | "
-        if isinstance(conta.cliente, PessoaFisica):
-            linha += f"Titular: {conta.cliente.nome} | Saldo: {conta.get_saldo_formatado()}"
-        print(linha)
+    linhas = ["\n🏦 CONTAS CADASTRADAS:", "-" * 100]
+    # O nome do titular é lido a cada listagem: PessoaFisica.nome pode ser alterado depois da abertura da conta
+    linhas.extend(
+        f"Agência: {conta.agencia} | Conta: {conta.numero} | Titular: {conta.cliente.titular_nome()}"
+        f" | Saldo: {conta.get_saldo_formatado()}"
+        for conta in contas
+    )
+    print("\n".join(linhas))
 
 
 def validar_cpf(cpf: str) -> bool:
     """Valida formato básico do CPF."""
-    cpf_numeros = "".join(filter(str.isdigit, cpf))
-    return len(cpf_numeros) == 11
+    # Caminho rápido para o caso comum (11 dígitos sem formatação); isdecimal aceita o mesmo que \d
+    if len(cpf) == 11 and cpf.isdecimal():
+        return True
+    return _CPF_RE.fullmatch(cpf) is not None
 
 
-def listar_usuarios(clientes: list[PessoaFisica]) -> None:
+def listar_usuarios(clientes: dict[str, PessoaFisica]) -> None:
     """Lista todos os usuários cadastrados."""
     if not clientes:
         print("📝 Nenhum usuário cadastrado no sistema.")
@@ -478,11 +685,11 @@ def listar_usuarios(clientes: list[PessoaFisica]) -> None:
 
     print("\n👥 USUÁRIOS CADASTRADOS:")
     print("-" * 60)
-    for cliente in clientes:
+    for cliente in clientes.values():
         print(f"👤 {cliente}")
 
 
-def gerar_relatorio_transacoes(clientes: list[PessoaFisica]) -> None:
+def gerar_relatorio_transacoes(clientes: dict[str, PessoaFisica]) -> None:
     """Gera relatório detalhado de transações por tipo."""
     cpf = input("Informe o CPF do cliente: ")
     cliente = filtrar_cliente(cpf, clientes)
@@ -505,17 +712,27 @@ def gerar_relatorio_transacoes(clientes: list[PessoaFisica]) -> None:
     else:
         relatorio = conta.historico.gerar_relatorio()
 
-    print(relatorio)
-
-    # Mostra transações do dia
+    # Relatório e resumo do dia em uma única escrita
     transacoes_hoje = conta.historico.transacoes_do_dia()
-    print(f"\n📅 Transações hoje: {len(transacoes_hoje)}")
-    print(f"💰 Saldo atual: {conta.get_saldo_formatado()}")
+    print(f"{relatorio}\n\n📅 Transações hoje: {len(transacoes_hoje)}\n💰 Saldo atual: {conta.get_saldo_formatado()}")
+
+
+# Operações do menu: opção -> (título exibido antes, função que recebe clientes e contas)
+_OPERACOES: dict[str, tuple[str | None, Callable[[dict[str, PessoaFisica], list[Conta]], None]]] = {
+    "1": (None, lambda clientes, contas: processar_criacao_usuario(clientes)),
+    "2": (None, processar_criacao_conta),
+    "3": ("\n💰 REALIZAR DEPÓSITO", lambda clientes, contas: processar_deposito(clientes)),
+    "4": ("\n💸 REALIZAR SAQUE", lambda clientes, contas: processar_saque(clientes)),
+    "5": ("\n📋 VISUALIZAR EXTRATO", lambda clientes, contas: exibir_extrato(clientes)),
+    "6": (None, lambda clientes, contas: listar_usuarios(clientes)),
+    "7": (None, lambda clientes, contas: listar_contas(contas)),
+    "8": ("\n📊 RELATÓRIO DE TRANSAÇÕES", lambda clientes, contas: gerar_relatorio_transacoes(clientes)),
+}
 
 
 def main() -> None:
     """Função principal do sistema bancário."""
-    clientes: list[PessoaFisica] = []
+    clientes: dict[str, PessoaFisica] = {}
     contas: list[Conta] = []
 
     print("🏦 Bem-vindo ao Sistema Bancário v3.0!")
@@ -527,40 +744,19 @@ def main() -> None:
         try:
             opcao = input("🔍 Escolha uma opção: ").strip()
 
-            if opcao == "1":
-                processar_criacao_usuario(clientes)
-
-            elif opcao == "2":
-                processar_criacao_conta(clientes, contas)
-
-            elif opcao == "3":
-                print("\n💰 REALIZAR DEPÓSITO")
-                processar_deposito(clientes)
-
-            elif opcao == "4":
-                print("\n💸 REALIZAR SAQUE")
-                processar_saque(clientes)
-
-            elif opcao == "5":
-                print("\n📋 VISUALIZAR EXTRATO")
-                exibir_extrato(clientes)
-
-            elif opcao == "6":
-                listar_usuarios(clientes)
-
-            elif opcao == "7":
-                listar_contas(contas)
-
-            elif opcao == "8":
-                print("\n📊 RELATÓRIO DE TRANSAÇÕES")
-                gerar_relatorio_transacoes(clientes)
-
-            elif opcao == "9":
+            if opcao == "9":
                 print("👋 Obrigado por usar o Sistema Bancário!")
                 break
 
-            else:
+            operacao = _OPERACOES.get(opcao)
+            if operacao is None:
                 print("❌ Opção inválida! Digite um número de 1 a 9.")
+                continue
+
+            titulo, executar = operacao
+            if titulo:
+                print(titulo)
+            executar(clientes, contas)
 
         except KeyboardInterrupt:
             print("\n\n👋 Sistema encerrado pelo usuário.")
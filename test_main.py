@@ -1,4 +1,5 @@
-from datetime import datetime
+from collections.abc import Callable
+from datetime import datetime, timedelta
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -13,7 +14,13 @@ from main import (
     PessoaFisica,
     Saque,
     Transacao,
+    _parse_valor_centavos,
     filtrar_cliente,
+    listar_contas,
+    main,
+    processar_criacao_usuario,
+    processar_deposito,
+    processar_saque,
     recuperar_conta_cliente,
     validar_cpf,
 )
@@ -40,8 +47,7 @@ class TestCliente:
         assert len(cliente.contas) == 1
         assert cliente.contas[0] == conta
 
-    @patch("builtins.print")
-    def test_limite_transacoes_diarias(self, mock_print: MagicMock) -> None:
+    def test_limite_transacoes_diarias(self, capsys: pytest.CaptureFixture[str]) -> None:
         """Testa limite de 10 transações por dia."""
         cliente = PessoaFisica("João", "01/01/1990", "12345678901", "Rua A, 123")
         conta = ContaCorrente(cliente)
@@ -52,7 +58,25 @@ class TestCliente:
             cliente.realizar_transacao(conta, deposito)
 
         # Verifica se a mensagem de limite foi exibida
-        mock_print.assert_any_call("❌ Erro: Limite de 10 transações por dia atingido!")
+        assert "❌ Erro: Limite de 10 transações por dia atingido!" in capsys.readouterr().out
+
+    def test_limite_transacoes_reinicia_no_dia_seguinte(self) -> None:
+        """Testa que transações de dias anteriores não contam para o limite diário."""
+        cliente = PessoaFisica("João", "01/01/1990", "12345678901", "Rua A, 123")
+        conta = ContaCorrente(cliente)
+
+        ontem = datetime.now() - timedelta(days=1)
+        for _i in range(10):
+            deposito = Deposito(100.0)
+            deposito.data_hora = ontem
+            conta.historico.adicionar_transacao(deposito)
+
+        assert conta.historico.quantidade_transacoes_do_dia == 0
+
+        cliente.realizar_transacao(conta, Deposito(100.0))
+
+        assert len(conta.historico.transacoes) == 11
+        assert conta.historico.quantidade_transacoes_do_dia == 1
 
 
 class TestPessoaFisica:
@@ -77,6 +101,13 @@ class TestPessoaFisica:
         # CPF formatado para exibição
         assert pessoa.get_cpf_formatado() == "123.456.789-01"
 
+    def test_titular_nome(self) -> None:
+        """Testa nome de titular da pessoa física e do cliente base."""
+        pessoa = PessoaFisica("Maria Santos", "01/01/1990", "12345678901", "Rua B, 456")
+
+        assert pessoa.titular_nome() == "Maria Santos"
+        assert Cliente("Rua B, 456").titular_nome() == "Cliente"
+
     def test_str_pessoa_fisica(self) -> None:
         """Testa representação string da pessoa física."""
         pessoa = PessoaFisica("Maria Santos", "01/01/1990", "12345678901", "Rua B, 456")
@@ -103,26 +134,25 @@ class TestConta:
         cliente2 = PessoaFisica("Maria", "01/01/1985", "98765432101", "Rua B, 456")
         conta2 = Conta(cliente2)
 
+        # Comparação relativa: o contador é global ao processo, mas as duas contas nascem no mesmo teste
+        # (e no mesmo worker do pytest-xdist), então o resultado não depende da ordem dos testes
         assert conta2.numero == self.conta.numero + 1
 
-    @patch("builtins.print")
-    def test_depositar_valor_valido(self, mock_print: MagicMock) -> None:
+    def test_depositar_valor_valido(self) -> None:
         """Testa depósito com valor válido."""
         resultado = self.conta.depositar(100.50)
 
         assert resultado is True
         assert self.conta.saldo == 100.50
 
-    @patch("builtins.print")
-    def test_depositar_valor_invalido(self, mock_print: MagicMock) -> None:
+    def test_depositar_valor_invalido(self) -> None:
         """Testa depósito com valor inválido."""
         resultado = self.conta.depositar(-10.0)
 
         assert resultado is False
         assert self.conta.saldo == 0.0
 
-    @patch("builtins.print")
-    def test_sacar_valor_valido(self, mock_print: MagicMock) -> None:
+    def test_sacar_valor_valido(self) -> None:
         """Testa saque com valor válido."""
         self.conta.depositar(200.00)
         resultado = self.conta.sacar(50.00)
@@ -130,8 +160,7 @@ class TestConta:
         assert resultado is True
         assert self.conta.saldo == 150.00
 
-    @patch("builtins.print")
-    def test_sacar_saldo_insuficiente(self, mock_print: MagicMock) -> None:
+    def test_sacar_saldo_insuficiente(self) -> None:
         """Testa saque com saldo insuficiente."""
         resultado = self.conta.sacar(100.0)
 
@@ -157,81 +186,139 @@ class TestConta:
 class TestContaCorrente:
     """Testes para a classe ContaCorrente."""
 
-    def setup_method(self) -> None:
-        """Setup executado antes de cada teste."""
-        self.cliente = PessoaFisica("João Silva", "01/01/1990", "12345678901", "Rua A, 123")
-        self.conta = ContaCorrente(self.cliente)
-
-    def test_criar_conta_corrente(self) -> None:
+    def test_criar_conta_corrente(
+        self, conta_corrente_imutavel: ContaCorrente, cliente_padrao_imutavel: PessoaFisica
+    ) -> None:
         """Testa criação de conta corrente."""
-        assert self.conta.agencia == "0001"
-        assert self.conta.numero >= 1
-        assert self.conta.cliente == self.cliente
-        assert self.conta.saldo == 0.0
+        assert conta_corrente_imutavel.agencia == "0001"
+        assert conta_corrente_imutavel.numero >= 1
+        assert conta_corrente_imutavel.cliente == cliente_padrao_imutavel
+        assert conta_corrente_imutavel.saldo == 0.0
+
+    def test_set_verbose_silencia_operacoes(
+        self, conta_corrente: ContaCorrente, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Testa que a conta silenciosa opera normalmente sem imprimir mensagens."""
+        conta_corrente.set_verbose(False)
 
-    def test_criar_conta_corrente_com_limites_personalizados(self) -> None:
+        assert conta_corrente.depositar(100.0) is True
+        assert conta_corrente.sacar(30.0) is True
+        assert conta_corrente.sacar(1000.0) is False
+        assert capsys.readouterr().out == ""
+        assert conta_corrente.saldo == 70.0
+
+        conta_corrente.set_verbose(True)
+        conta_corrente.depositar(1.0)
+        assert capsys.readouterr().out.startswith("✅ Depósito realizado com sucesso!")
+
+    def test_criar_conta_corrente_com_limites_personalizados(self, cliente_padrao_imutavel: PessoaFisica) -> None:
         """Testa criação de conta corrente com limites personalizados."""
-        conta = ContaCorrente(self.cliente, limite=1000.0, limite_saques=5)
+        conta = ContaCorrente(cliente_padrao_imutavel, limite=1000.0, limite_saques=5)
 
         assert conta._limite_centavos == 100000  # R$ 1000 em centavos
         assert conta._limite_saques == 5
 
-    @patch("builtins.print")
-    def test_sacar_limite_valor_excedido(self, mock_print: MagicMock) -> None:
+    def test_sacar_limite_valor_excedido(
+        self, conta_corrente: ContaCorrente, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Testa saque que excede limite por operação."""
-        self.conta.depositar(1000.0)
-        resultado = self.conta.sacar(600.0)  # Acima do limite de R$ 500
+        conta_corrente.depositar(1000.0)
+        resultado = conta_corrente.sacar(600.0)  # Acima do limite de R$ 500
 
         assert resultado is False
-        assert self.conta.saldo == 1000.0
+        assert conta_corrente.saldo == 1000.0
+        assert capsys.readouterr().out.endswith("❌ Erro: Valor excede o limite máximo de R$ 500.00 por saque!\n")
 
-    @patch("builtins.print")
-    @patch("main.datetime")
-    def test_sacar_limite_diario_excedido(self, mock_datetime: MagicMock, mock_print: MagicMock) -> None:
+    def test_sacar_limite_diario_excedido(
+        self, conta_corrente: ContaCorrente, fixar_agora: Callable[[datetime], None]
+    ) -> None:
         """Testa limite de 3 saques diários."""
-        mock_datetime.now.return_value.strftime.return_value = "10/06/2025"
+        fixar_agora(datetime(2025, 6, 10, 10, 0, 0))
 
-        self.conta.depositar(1000.0)
+        conta_corrente.depositar(1000.0)
 
         # Realiza 3 saques válidos
         for _i in range(3):
-            resultado = self.conta.sacar(100.0)
+            resultado = conta_corrente.sacar(100.0)
             assert resultado is True
 
         # Quarto saque deve falhar
-        resultado = self.conta.sacar(100.0)
+        resultado = conta_corrente.sacar(100.0)
         assert resultado is False
 
-    def test_str_conta_corrente(self) -> None:
+    def test_str_conta_corrente(self, conta_corrente_imutavel: ContaCorrente) -> None:
         """Testa representação string da conta corrente."""
-        str_conta = str(self.conta)
+        str_conta = str(conta_corrente_imutavel)
 
         assert "Agência:" in str_conta
         assert "C/C:" in str_conta
         assert "Titular:" in str_conta
-        assert self.conta.agencia in str_conta
+        assert conta_corrente_imutavel.agencia in str_conta
 
-    @patch("builtins.print")
-    def test_reset_contador_saques_novo_dia(self, mock_print: MagicMock) -> None:
+    def test_reset_contador_saques_novo_dia(
+        self, conta_corrente: ContaCorrente, fixar_agora: Callable[[datetime], None]
+    ) -> None:
         """Testa reset do contador de saques em novo dia."""
-        self.conta.depositar(1000.0)
+        conta_corrente.depositar(1000.0)
 
         # Simula saques no primeiro dia
-        with patch("main.datetime") as mock_datetime:
-            mock_datetime.now.return_value.strftime.return_value = "10/06/2025"
+        fixar_agora(datetime(2025, 6, 10, 10, 0, 0))
 
-            for _i in range(3):
-                self.conta.sacar(100.0)
+        for _i in range(3):
+            conta_corrente.sacar(100.0)
 
-            # Quarto saque deve falhar
-            assert self.conta.sacar(100.0) is False
+        # Quarto saque deve falhar
+        assert conta_corrente.sacar(100.0) is False
 
         # Simula novo dia
-        with patch("main.datetime") as mock_datetime:
-            mock_datetime.now.return_value.strftime.return_value = "11/06/2025"
+        fixar_agora(datetime(2025, 6, 11, 10, 0, 0))
+
+        # Deve conseguir sacar novamente
+        assert conta_corrente.sacar(100.0) is True
+
+    def test_saque_retroativo_respeita_limite_do_proprio_dia(
+        self, conta_corrente: ContaCorrente, fixar_agora: Callable[[datetime], None]
+    ) -> None:
+        """Testa que o limite de saques vale para o dia do saque, qualquer que seja a data."""
+        fixar_agora(datetime(2025, 6, 10, 10, 0, 0))
+        conta_corrente.depositar(1000.0)
+        ontem = datetime(2025, 6, 9, 10, 0, 0)
+
+        for _i in range(3):
+            assert conta_corrente.sacar(10.0) is True
 
-            # Deve conseguir sacar novamente
-            assert self.conta.sacar(100.0) is True
+        # Dia atual cheio: quarto saque falha
+        assert conta_corrente.sacar(10.0) is False
+
+        # O dia anterior tem limite próprio: três saques retroativos passam, o quarto falha
+        for _i in range(3):
+            Saque(10.0, ontem).registrar(conta_corrente)
+        Saque(10.0, ontem).registrar(conta_corrente)
+
+        assert len(conta_corrente.historico.transacoes) == 3
+        assert conta_corrente.saldo == 940.0
+        assert conta_corrente.sacar(10.0) is False
+
+    def test_saque_registra_pela_api_publica_da_conta(self, cliente_padrao: PessoaFisica) -> None:
+        """Testa que Saque e Deposito passam pelos métodos públicos que subclasses de Conta personalizam."""
+        chamadas: list[tuple[str, int]] = []
+
+        class ContaAuditada(ContaCorrente):
+            __slots__ = ()
+
+            def sacar_centavos(self, valor_centavos: int, dia: int | None = None) -> bool:
+                chamadas.append(("saque", valor_centavos))
+                return super().sacar_centavos(valor_centavos, dia)
+
+            def depositar_centavos(self, valor_centavos: int) -> bool:
+                chamadas.append(("deposito", valor_centavos))
+                return super().depositar_centavos(valor_centavos)
+
+        conta = ContaAuditada(cliente_padrao)
+        Deposito(100.0).registrar(conta)
+        Saque(30.0).registrar(conta)
+
+        assert chamadas == [("deposito", 10000), ("saque", 3000)]
 
 
 class TestHistorico:
@@ -289,6 +376,35 @@ class TestHistorico:
         assert "Saque" in relatorio_saque
         assert "Deposito" not in relatorio_saque
 
+    def test_gerar_relatorio_por_tipo_ignora_maiusculas(self) -> None:
+        """Testa que o filtro por tipo não diferencia maiúsculas de minúsculas e preserva a ordem."""
+        primeiro = Saque(10.0)
+        segundo = Saque(20.0)
+
+        self.historico.adicionar_transacao(primeiro)
+        self.historico.adicionar_transacao(Deposito(100.0))
+        self.historico.adicionar_transacao(segundo)
+
+        linhas = self.historico.gerar_relatorio("SAQUE").split("\n")
+
+        assert len(linhas) == 2
+        assert linhas[0].endswith("Saque: R$ 10.00")
+        assert linhas[1].endswith("Saque: R$ 20.00")
+
+    def test_gerar_relatorio_data_hora_por_transacao(self) -> None:
+        """Testa que cada linha do relatório traz a data/hora (ao segundo) da própria transação."""
+        self.historico.adicionar_transacao(Deposito(1.0, datetime(2025, 6, 14, 10, 0, 0, 100)))
+        self.historico.adicionar_transacao(Deposito(2.0, datetime(2025, 6, 14, 10, 0, 0, 900)))
+        self.historico.adicionar_transacao(Saque(3.0, datetime(2025, 6, 14, 10, 0, 1)))
+
+        linhas = self.historico.gerar_relatorio().split("\n")
+
+        assert linhas == [
+            "14/06/2025 10:00:00 - Deposito: R$ 1.00",
+            "14/06/2025 10:00:00 - Deposito: R$ 2.00",
+            "14/06/2025 10:00:01 - Saque: R$ 3.00",
+        ]
+
     def test_gerar_relatorio_tipo_inexistente(self) -> None:
         """Testa geração de relatório para tipo que não existe."""
         deposito = Deposito(100.0)
@@ -297,18 +413,13 @@ class TestHistorico:
         relatorio = self.historico.gerar_relatorio("transferencia")
         assert "Nenhuma transação do tipo 'transferencia' encontrada" in relatorio
 
-    @patch("main.datetime")
-    def test_transacoes_do_dia(self, mock_datetime: MagicMock) -> None:
+    def test_transacoes_do_dia(self, fixar_agora: Callable[[datetime], None]) -> None:
         """Testa filtro de transações do dia."""
-        # Mock da data atual
-        mock_date = datetime(2025, 6, 14).date()
-        mock_datetime.now.return_value.date.return_value = mock_date
+        # Fixa o relógio
+        fixar_agora(datetime(2025, 6, 14, 10, 0, 0))
 
-        deposito = Deposito(100.0)
-        deposito.data_hora = datetime(2025, 6, 14, 10, 0, 0)
-
-        saque = Saque(50.0)
-        saque.data_hora = datetime(2025, 6, 13, 10, 0, 0)  # Dia anterior
+        deposito = Deposito(100.0, datetime(2025, 6, 14, 10, 0, 0))
+        saque = Saque(50.0, datetime(2025, 6, 13, 10, 0, 0))  # Dia anterior
 
         self.historico.adicionar_transacao(deposito)
         self.historico.adicionar_transacao(saque)
@@ -318,6 +429,29 @@ class TestHistorico:
         assert len(transacoes_hoje) == 1
         assert transacoes_hoje[0] == deposito
 
+    def test_limite_diario_segue_relogio_do_modulo(self, fixar_agora: Callable[[datetime], None]) -> None:
+        """Testa que, com o relógio fixado, o limite diário de transações continua valendo."""
+        fixar_agora(datetime(2025, 6, 14, 10, 0, 0))
+        cliente = PessoaFisica("João", "01/01/1990", "12345678901", "Rua A")
+        conta = ContaCorrente(cliente)
+
+        for _i in range(15):
+            cliente.realizar_transacao(conta, Deposito(10.0))
+
+        assert len(conta.historico.transacoes) == 10
+        assert conta.historico.quantidade_transacoes_do_dia == 10
+
+    def test_transacao_retroativa_nao_zera_contador_do_dia(self, fixar_agora: Callable[[datetime], None]) -> None:
+        """Testa que uma transação com data anterior não zera o contador do dia atual."""
+        fixar_agora(datetime(2025, 6, 14, 10, 0, 0))
+
+        for hora in range(10, 15):
+            self.historico.adicionar_transacao(Deposito(100.0, datetime(2025, 6, 14, hora, 0, 0)))
+        self.historico.adicionar_transacao(Deposito(100.0, datetime(2025, 6, 12, 10, 0, 0)))
+
+        assert self.historico.quantidade_transacoes_do_dia == 5
+        assert len(self.historico.transacoes_do_dia()) == 5
+
 
 class TestTransacoes:
     """Testes para as classes de transação."""
@@ -327,8 +461,7 @@ class TestTransacoes:
         self.cliente = PessoaFisica("João", "01/01/1990", "12345678901", "Rua A, 123")
         self.conta = ContaCorrente(self.cliente)
 
-    @patch("builtins.print")
-    def test_deposito(self, mock_print: MagicMock) -> None:
+    def test_deposito(self) -> None:
         """Testa transação de depósito."""
         deposito = Deposito(100.0)
 
@@ -340,8 +473,7 @@ class TestTransacoes:
         assert self.conta.saldo == 100.0
         assert len(self.conta.historico.transacoes) == 1
 
-    @patch("builtins.print")
-    def test_saque(self, mock_print: MagicMock) -> None:
+    def test_saque(self) -> None:
         """Testa transação de saque."""
         # Primeiro faz um depósito
         self.conta.depositar(200.0)
@@ -356,8 +488,7 @@ class TestTransacoes:
         assert self.conta.saldo == 150.0
         assert len(self.conta.historico.transacoes) == 1  # Só o saque é registrado no histórico
 
-    @patch("builtins.print")
-    def test_saque_saldo_insuficiente(self, mock_print: MagicMock) -> None:
+    def test_saque_saldo_insuficiente(self) -> None:
         """Testa saque com saldo insuficiente."""
         saque = Saque(100.0)
         saque.registrar(self.conta)
@@ -365,6 +496,34 @@ class TestTransacoes:
         assert self.conta.saldo == 0.0
         assert len(self.conta.historico.transacoes) == 0  # Transação não registrada
 
+    def test_saque_usa_dia_da_transacao(self) -> None:
+        """Testa que o limite diário de saques considera a data do próprio Saque."""
+        self.conta.depositar(500.0)
+        ontem = datetime.now() - timedelta(days=1)
+
+        for _ in range(3):
+            Saque(10.0, ontem).registrar(self.conta)
+
+        # O limite de 3 saques foi consumido ontem: hoje ainda é possível sacar
+        Saque(10.0).registrar(self.conta)
+
+        assert self.conta.saldo == 460.0
+        assert len(self.conta.historico.transacoes) == 4
+
+    def test_tipo_da_transacao(self) -> None:
+        """Testa a chave de tipo usada pelo índice do histórico, inclusive em subclasses novas."""
+
+        class Transferencia(Transacao):
+            def registrar(self, conta: Conta) -> None:
+                conta.historico.adicionar_transacao(self)
+
+        assert Saque._TIPO == "saque"
+        assert Deposito._TIPO == "deposito"
+        assert Transferencia._TIPO == "transferencia"
+
+        Transferencia(10.0).registrar(self.conta)
+        assert "Transferencia: R$ 10.00" in self.conta.historico.gerar_relatorio("transferencia")
+
     def test_transacao_heranca(self) -> None:
         """Testa que as classes herdam corretamente de Transacao."""
         deposito = Deposito(100.0)
@@ -390,10 +549,64 @@ class TestTransacoes:
         assert deposito.valor == 250.75
         assert saque.valor == 150.25
 
+    def test_valor_guardado_em_centavos(self) -> None:
+        """Testa que o valor é guardado em centavos: em reais ele sai arredondado para centavos."""
+        assert Deposito(0.004).valor == 0.0
+        assert Saque(10.456).valor == 10.46
+        assert Deposito(valor_centavos=12345678901234567891).valor_centavos == 12345678901234567891
+
+        with pytest.raises(TypeError):
+            Deposito()
+
+    def test_data_hora_usa_relogio_do_modulo(self) -> None:
+        """Testa que a data/hora vem do relógio substituível ou do parâmetro explícito."""
+        instante = datetime(2025, 6, 14, 10, 0, 0)
+        with patch("main._clock", return_value=instante) as mock_clock:
+            assert Deposito(10.0).data_hora == instante
+            assert Saque(5.0, datetime(2024, 1, 1)).data_hora == datetime(2024, 1, 1)
+
+        mock_clock.assert_called_once()
+
+    def test_pode_aplicar_rejeita_valor_nao_positivo(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Testa a validação prévia do valor, feita antes de criar a transação."""
+        assert Deposito.pode_aplicar(1000)
+        assert Saque.pode_aplicar(1)
+
+        assert not Deposito.pode_aplicar(0)
+        assert not Saque.pode_aplicar(-500)
+        assert capsys.readouterr().out.splitlines() == [
+            "❌ Erro: O valor do depósito deve ser positivo!",
+            "❌ Erro: O valor do saque deve ser positivo!",
+        ]
+
 
 class TestFuncoesUtilitarias:
     """Testes para funções utilitárias."""
 
+    @pytest.mark.parametrize(
+        ("texto", "esperado"),
+        [
+            ("100", 10000),
+            ("0.29", 29),
+            ("10,5", 1050),
+            (" 1.999 ", 199),
+            (".5", 50),
+            ("-20", -2000),
+            ("abc", None),
+            ("", None),
+            ("1.2.3", None),
+        ],
+    )
+    def test_parse_valor_centavos(self, texto: str, esperado: int | None) -> None:
+        """Testa a conversão do valor digitado direto para centavos."""
+        assert _parse_valor_centavos(texto) == esperado
+
+    def test_deposito_sem_erro_de_arredondamento(self) -> None:
+        """Testa que valores como 0.29 não perdem um centavo na conversão."""
+        conta = ContaCorrente(PessoaFisica("João", "01/01/1990", "12345678901", "Rua A"))
+        conta.depositar(0.29)
+        assert conta._saldo_centavos == 29
+
     def test_validar_cpf_valido(self) -> None:
         """Testa validação de CPF válido."""
         assert validar_cpf("12345678901") is True
@@ -408,10 +621,9 @@ class TestFuncoesUtilitarias:
 
     def test_filtrar_cliente_existente(self) -> None:
         """Testa filtro de cliente existente."""
-        clientes = [
-            PessoaFisica("João", "01/01/1990", "12345678901", "Rua A"),
-            PessoaFisica("Maria", "01/01/1985", "98765432101", "Rua B"),
-        ]
+        joao = PessoaFisica("João", "01/01/1990", "12345678901", "Rua A")
+        maria = PessoaFisica("Maria", "01/01/1985", "98765432101", "Rua B")
+        clientes = {joao.cpf: joao, maria.cpf: maria}
 
         cliente = filtrar_cliente("123.456.789-01", clientes)
         assert cliente is not None
@@ -419,20 +631,96 @@ class TestFuncoesUtilitarias:
 
     def test_filtrar_cliente_inexistente(self) -> None:
         """Testa filtro de cliente inexistente."""
-        clientes = [PessoaFisica("João", "01/01/1990", "12345678901", "Rua A")]
+        joao = PessoaFisica("João", "01/01/1990", "12345678901", "Rua A")
+        clientes = {joao.cpf: joao}
 
         cliente = filtrar_cliente("99999999999", clientes)
         assert cliente is None
 
     def test_filtrar_cliente_lista_vazia(self) -> None:
-        """Testa filtro com lista vazia de clientes."""
-        clientes: list[PessoaFisica] = []
+        """Testa filtro com índice vazio de clientes."""
+        clientes: dict[str, PessoaFisica] = {}
         cliente = filtrar_cliente("12345678901", clientes)
         assert cliente is None
 
+    def test_processar_criacao_usuario_indexa_por_cpf(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Testa que o usuário criado é indexado pelo CPF normalizado e não pode ser duplicado."""
+        clientes: dict[str, PessoaFisica] = {}
+        dados = ["João", "01/01/1990", "123.456.789-01", "Rua A", "123", "Centro", "São Paulo", "SP"]
+
+        with patch("builtins.input", side_effect=dados):
+            processar_criacao_usuario(clientes)
+
+        assert list(clientes) == ["12345678901"]
+        assert filtrar_cliente("123.456.789-01", clientes) is clientes["12345678901"]
+
+        with patch("builtins.input", side_effect=dados):
+            processar_criacao_usuario(clientes)
+
+        assert len(clientes) == 1
+        assert "❌ Erro: Já existe cliente com esse CPF!" in capsys.readouterr().out
+
+    def test_processar_deposito_preserva_centavos_de_valores_grandes(self) -> None:
+        """Testa que o valor digitado chega ao saldo em centavos exatos, sem passar por float."""
+        cliente = PessoaFisica("João", "01/01/1990", "12345678901", "Rua A")
+        conta = ContaCorrente(cliente)
+        cliente.adicionar_conta(conta)
+
+        with patch("builtins.input", side_effect=["12345678901", "123456789012345678,91"]):
+            processar_deposito({cliente.cpf: cliente})
+
+        assert conta.get_saldo_formatado() == "R$ 123456789012345678.91"
+        assert conta.historico.transacoes[0].valor_centavos == 12345678901234567891
+
+    def test_processar_saque_verifica_limite_diario_uma_vez(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Testa que, com o limite diário atingido, o saque pelo menu é recusado com uma única mensagem."""
+        cliente = PessoaFisica("João", "01/01/1990", "12345678901", "Rua A")
+        conta = ContaCorrente(cliente)
+        cliente.adicionar_conta(conta)
+        for _i in range(10):
+            cliente.realizar_transacao(conta, Deposito(10.0))
+        capsys.readouterr()
+
+        with patch("builtins.input", side_effect=["12345678901", "10"]):
+            processar_saque({cliente.cpf: cliente})
+
+        assert capsys.readouterr().out.count("❌ Erro: Limite de 10 transações por dia atingido!") == 1
+        assert conta.saldo == 100.0
+
+    def test_listar_contas(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Testa a listagem de contas com titular e saldo atualizado."""
+        cliente = PessoaFisica("Maria", "01/01/1990", "12345678901", "Rua A")
+        conta = ContaCorrente(cliente, numero=7)
+        conta.set_verbose(False)
+        conta.depositar(12.5)
+
+        listar_contas([conta])
+
+        linhas = capsys.readouterr().out.splitlines()
+        assert linhas[-1] == "Agência: 0001 | Conta: 7 | Titular: Maria | Saldo: R$ 12.50"
+
+        cliente.nome = "Maria Souza"
+        listar_contas([conta])
+
+        assert (
+            capsys.readouterr().out.splitlines()[-1]
+            == "Agência: 0001 | Conta: 7 | Titular: Maria Souza | Saldo: R$ 12.50"
+        )
+
+    def test_main_despacha_opcoes_do_menu(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Testa o menu principal dirigido por entradas: opção válida, inválida e saída."""
+        entradas = ["3", "00000000000", "x", "9"]
+        with patch("builtins.input", side_effect=entradas):
+            main()
+
+        linhas = capsys.readouterr().out.splitlines()
+        assert "💰 REALIZAR DEPÓSITO" in linhas
+        assert "❌ Cliente não encontrado!" in linhas
+        assert "❌ Opção inválida! Digite um número de 1 a 9." in linhas
+        assert linhas[-1] == "👋 Obrigado por usar o Sistema Bancário!"
+
     @patch("builtins.input", return_value="1")
-    @patch("builtins.print")
-    def test_recuperar_conta_cliente_uma_conta(self, mock_print: MagicMock, mock_input: MagicMock) -> None:
+    def test_recuperar_conta_cliente_uma_conta(self, mock_input: MagicMock) -> None:
         """Testa recuperação de conta quando cliente tem apenas uma."""
         cliente = PessoaFisica("João", "01/01/1990", "12345678901", "Rua A")
         conta = ContaCorrente(cliente)
@@ -442,19 +730,17 @@ class TestFuncoesUtilitarias:
 
         assert conta_recuperada == conta
 
-    @patch("builtins.print")
-    def test_recuperar_conta_cliente_sem_conta(self, mock_print: MagicMock) -> None:
+    def test_recuperar_conta_cliente_sem_conta(self, capsys: pytest.CaptureFixture[str]) -> None:
         """Testa recuperação de conta quando cliente não tem contas."""
         cliente = PessoaFisica("João", "01/01/1990", "12345678901", "Rua A")
 
         conta_recuperada = recuperar_conta_cliente(cliente)
 
         assert conta_recuperada is None
-        mock_print.assert_called_with("\n❌ Cliente não possui conta!")
+        assert capsys.readouterr().out == "\n❌ Cliente não possui conta!\n"
 
     @patch("builtins.input", return_value="1")
-    @patch("builtins.print")
-    def test_recuperar_conta_multiplas_contas(self, mock_print: MagicMock, mock_input: MagicMock) -> None:
+    def test_recuperar_conta_multiplas_contas(self, mock_input: MagicMock) -> None:
         """Testa recuperação quando cliente tem múltiplas contas."""
         cliente = PessoaFisica("João", "01/01/1990", "12345678901", "Rua A")
         conta1 = ContaCorrente(cliente)
@@ -468,8 +754,7 @@ class TestFuncoesUtilitarias:
         assert conta_recuperada == conta1  # Primeira conta (escolha 1)
 
     @patch("builtins.input", return_value="abc")
-    @patch("builtins.print")
-    def test_recuperar_conta_entrada_invalida(self, mock_print: MagicMock, mock_input: MagicMock) -> None:
+    def test_recuperar_conta_entrada_invalida(self, mock_input: MagicMock, capsys: pytest.CaptureFixture[str]) -> None:
         """Testa recuperação com entrada inválida."""
         cliente = PessoaFisica("João", "01/01/1990", "12345678901", "Rua A")
         conta1 = ContaCorrente(cliente)
@@ -481,9 +766,10 @@ class TestFuncoesUtilitarias:
         conta_recuperada = recuperar_conta_cliente(cliente)
 
         assert conta_recuperada is None
-        mock_print.assert_any_call("❌ Digite um número válido!")
+        assert "❌ Digite um número válido!" in capsys.readouterr().out
 
 
+@pytest.mark.integration
 class TestIntegracao:
     """Testes de integração do sistema completo."""
 
@@ -492,8 +778,7 @@ class TestIntegracao:
         self.clientes: list[PessoaFisica] = []
         self.contas: list[ContaCorrente] = []
 
-    @patch("builtins.print")
-    def test_fluxo_completo_cliente_conta_operacoes(self, mock_print: MagicMock) -> None:
+    def test_fluxo_completo_cliente_conta_operacoes(self) -> None:
         """Testa fluxo completo: criar cliente, conta e fazer operações."""
         # Criar cliente
         cliente = PessoaFisica("João Silva", "01/01/1990", "12345678901", "Rua A, 123")
@@ -514,8 +799,7 @@ class TestIntegracao:
         assert conta.saldo == 300.0
         assert len(conta.historico.transacoes) == 2
 
-    @patch("builtins.print")
-    def test_multiplos_clientes_e_contas(self, mock_print: MagicMock) -> None:
+    def test_multiplos_clientes_e_contas(self) -> None:
         """Testa sistema com múltiplos clientes e contas."""
         # Criar clientes
         cliente1 = PessoaFisica("João", "01/01/1990", "11111111111", "Rua A")
@@ -532,8 +816,7 @@ class TestIntegracao:
         assert conta1.numero != conta2.numero
         assert conta1.cliente != conta2.cliente
 
-    @patch("builtins.print")
-    def test_cliente_multiplas_contas(self, mock_print: MagicMock) -> None:
+    def test_cliente_multiplas_contas(self) -> None:
         """Testa cliente com múltiplas contas."""
         # Criar cliente
         cliente = PessoaFisica("João", "01/01/1990", "12345678901", "Rua A")
@@ -550,8 +833,7 @@ class TestIntegracao:
         assert conta2.cliente == cliente
         assert conta1.numero != conta2.numero
 
-    @patch("builtins.print")
-    def test_limite_transacoes_integrado(self, mock_print: MagicMock) -> None:
+    def test_limite_transacoes_integrado(self) -> None:
         """Testa limite de transações de forma integrada."""
         cliente = PessoaFisica("João", "01/01/1990", "12345678901", "Rua A")
         conta = ContaCorrente(cliente)
@@ -571,38 +853,15 @@ class TestIntegracao:
         assert len(conta.historico.transacoes) == 10  # Não aumentou
 
 
-# Fixture para testes
-@pytest.fixture
-def cliente_padrao() -> PessoaFisica:
-    """Fixture que retorna um cliente padrão para testes."""
-    return PessoaFisica("João Silva", "01/01/1990", "12345678901", "Rua A, 123 - Centro - SP/SP")
-
-
-@pytest.fixture
-def conta_corrente(cliente_padrao: PessoaFisica) -> ContaCorrente:
-    """Fixture que retorna uma conta corrente para testes."""
-    return ContaCorrente(cliente_padrao)
-
-
-@pytest.fixture
-def conta_com_saldo(cliente_padrao: PessoaFisica) -> ContaCorrente:
-    """Fixture que retorna uma conta corrente com saldo."""
-    conta = ContaCorrente(cliente_padrao)
-    conta.depositar(1000.0)
-    return conta
-
-
-@pytest.fixture
+# Fixture para testes (cliente_padrao, conta_corrente e fabrica_conta vêm do conftest.py)
+@pytest.fixture(scope="module")
 def sistema_com_dados() -> tuple[list[PessoaFisica], list[ContaCorrente]]:
-    """Fixture que retorna sistema com dados de teste."""
-    clientes: list[PessoaFisica] = []
-    contas: list[ContaCorrente] = []
-
+    """Fixture que retorna sistema com dados de teste, montado uma vez por módulo (somente leitura)."""
     # Criar clientes
     cliente1 = PessoaFisica("João Silva", "01/01/1990", "11111111111", "Rua A, 123")
     cliente2 = PessoaFisica("Maria Santos", "15/05/1985", "22222222222", "Rua B, 456")
 
-    clientes.extend([cliente1, cliente2])
+    clientes: list[PessoaFisica] = [cliente1, cliente2]
 
     # Criar contas
     conta1 = ContaCorrente(cliente1)
@@ -611,7 +870,7 @@ def sistema_com_dados() -> tuple[list[PessoaFisica], list[ContaCorrente]]:
     cliente1.adicionar_conta(conta1)
     cliente2.adicionar_conta(conta2)
 
-    contas.extend([conta1, conta2])
+    contas: list[ContaCorrente] = [conta1, conta2]
 
     return clientes, contas
 
@@ -625,20 +884,22 @@ class TestComFixtures:
         assert cliente_padrao.nome == "João Silva"
         assert cliente_padrao.cpf == "12345678901"
 
-    def test_conta_corrente_fixture(self, conta_corrente: ContaCorrente) -> None:
+    def test_conta_corrente_fixture(self, conta_corrente_imutavel: ContaCorrente) -> None:
         """Testa fixture de conta corrente."""
-        assert conta_corrente.agencia == "0001"
-        assert isinstance(conta_corrente.cliente, PessoaFisica)
-        assert conta_corrente.cliente.nome == "João Silva"
-        assert conta_corrente.saldo == 0.0
-
-    def test_conta_com_saldo_fixture(self, conta_com_saldo: ContaCorrente) -> None:
-        """Testa fixture de conta com saldo."""
-        assert conta_com_saldo.saldo == 1000.0
-
-    @patch("builtins.print")
-    def test_transacao_com_fixture(self, mock_print: MagicMock, conta_com_saldo: ContaCorrente) -> None:
+        assert conta_corrente_imutavel.agencia == "0001"
+        assert isinstance(conta_corrente_imutavel.cliente, PessoaFisica)
+        assert conta_corrente_imutavel.cliente.nome == "João Silva"
+        assert conta_corrente_imutavel.saldo == 0.0
+
+    def test_fabrica_conta_fixture(self, fabrica_conta: Callable[..., ContaCorrente]) -> None:
+        """Testa fixture fábrica de contas com depósitos e saques iniciais."""
+        assert fabrica_conta().saldo == 0.0
+        assert fabrica_conta(depositos=[1000.0]).saldo == 1000.0
+        assert fabrica_conta(depositos=[1000.0, 500.0], saques=[200.0, 100.0]).saldo == 1200.0
+
+    def test_transacao_com_fixture(self, fabrica_conta: Callable[..., ContaCorrente]) -> None:
         """Testa transação usando fixture."""
+        conta_com_saldo = fabrica_conta(depositos=[1000.0])
         saque = Saque(200.0)
         saque.registrar(conta_com_saldo)
 
@@ -660,12 +921,9 @@ class TestParametrizados:
     """Testes parametrizados."""
 
     @pytest.mark.parametrize("valor_deposito", [100.0, 500.0, 1000.0])
-    @patch("builtins.print")
-    def test_depositos_parametrizados(
-        self, mock_print: MagicMock, valor_deposito: float, cliente_padrao: PessoaFisica
-    ) -> None:
+    def test_depositos_parametrizados(self, valor_deposito: float, cliente_padrao_imutavel: PessoaFisica) -> None:
         """Testa depósitos com valores parametrizados."""
-        conta = ContaCorrente(cliente_padrao)
+        conta = ContaCorrente(cliente_padrao_imutavel)
         deposito = Deposito(valor_deposito)
 
         deposito.registrar(conta)
@@ -682,6 +940,9 @@ class TestParametrizados:
             ("", False),
             ("abcdefghijk", False),
             ("123.456.789-0", False),
+            (" 123 456 789 01 ", True),
+            ("123.456.789-01-2", False),
+            ("¹²³⁴⁵⁶⁷⁸⁹⁰¹", False),
         ],
     )
     def test_validacao_cpf_parametrizada(self, cpf: str, esperado: bool) -> None:
@@ -700,29 +961,20 @@ class TestParametrizados:
             (-50.0, 100.0, False),  # Valor negativo
         ],
     )
-    @patch("builtins.print")
     def test_saques_parametrizados(
-        self,
-        mock_print: MagicMock,
-        valor_saque: float,
-        saldo_inicial: float,
-        deve_funcionar: bool,
-        cliente_padrao: PessoaFisica,
+        self, valor_saque: float, saldo_inicial: float, deve_funcionar: bool, cliente_padrao_imutavel: PessoaFisica
     ) -> None:
         """Testa saques com diferentes parâmetros."""
-        conta = ContaCorrente(cliente_padrao)
+        conta = ContaCorrente(cliente_padrao_imutavel)
         conta.depositar(saldo_inicial)
 
         resultado = conta.sacar(valor_saque)
         assert resultado == deve_funcionar
 
     @pytest.mark.parametrize("limite_personalizado", [300.0, 700.0, 1000.0])
-    @patch("builtins.print")
-    def test_limites_personalizados(
-        self, mock_print: MagicMock, limite_personalizado: float, cliente_padrao: PessoaFisica
-    ) -> None:
+    def test_limites_personalizados(self, limite_personalizado: float, cliente_padrao_imutavel: PessoaFisica) -> None:
         """Testa contas com limites personalizados."""
-        conta = ContaCorrente(cliente_padrao, limite=limite_personalizado)
+        conta = ContaCorrente(cliente_padrao_imutavel, limite=limite_personalizado)
         conta.depositar(2000.0)
 
         # Saque dentro do limite deve funcionar
@@ -735,26 +987,27 @@ class TestParametrizados:
 
 
 # Testes de performance e stress
+@pytest.mark.performance
 class TestPerformance:
     """Testes de performance do sistema."""
 
-    @patch("builtins.print")
-    def test_muitas_transacoes(self, mock_print: MagicMock) -> None:
+    def test_muitas_transacoes(self) -> None:
         """Testa sistema com muitas transações."""
         cliente = PessoaFisica("João", "01/01/1990", "12345678901", "Rua A")
         conta = ContaCorrente(cliente)
 
-        # Fazer muitos depósitos pequenos
-        for i in range(100):
-            deposito = Deposito(10.0)
-            if i < 10:  # Só as primeiras 10 são registradas (limite diário)
-                cliente.realizar_transacao(conta, deposito)
+        # Fazer depósitos pequenos até o limite diário de 10 transações
+        for _ in range(10):
+            cliente.realizar_transacao(conta, Deposito(10.0))
+
+        # A 11ª transação do dia é recusada
+        cliente.realizar_transacao(conta, Deposito(10.0))
 
         assert conta.saldo == 100.0  # 10 depósitos de R$ 10
         assert len(conta.historico.transacoes) == 10
 
-    @patch("builtins.print")
-    def test_muitos_clientes(self, mock_print: MagicMock) -> None:
+    @pytest.mark.slow
+    def test_muitos_clientes(self) -> None:
         """Testa sistema com muitos clientes."""
         clientes = []
         contas = []
@@ -782,52 +1035,33 @@ class TestPerformance:
 class TestEdgeCases:
     """Testes de casos extremos."""
 
-    @patch("builtins.print")
-    def test_valor_muito_pequeno(self, mock_print: MagicMock) -> None:
-        """Testa operações com valores muito pequenos."""
-        cliente = PessoaFisica("João", "01/01/1990", "12345678901", "Rua A")
-        conta = ContaCorrente(cliente)
+    @pytest.mark.parametrize("valor", [0.01, 999999.99], ids=["um_centavo", "muito_grande"])
+    def test_deposito_valores_extremos(self, valor: float, cliente_padrao_imutavel: PessoaFisica) -> None:
+        """Testa depósitos com valores muito pequenos e muito grandes."""
+        conta = ContaCorrente(cliente_padrao_imutavel)
 
-        # Depósito de 1 centavo
-        resultado = conta.depositar(0.01)
+        resultado = conta.depositar(valor)
         assert resultado is True
-        assert conta.saldo == 0.01
+        assert conta.saldo == valor
 
-    @patch("builtins.print")
-    def test_valor_muito_grande(self, mock_print: MagicMock) -> None:
-        """Testa operações com valores muito grandes."""
-        cliente = PessoaFisica("João", "01/01/1990", "12345678901", "Rua A")
-        conta = ContaCorrente(cliente)
-
-        # Depósito muito grande
-        valor_grande = 999999.99
-        resultado = conta.depositar(valor_grande)
-        assert resultado is True
-        assert conta.saldo == valor_grande
-
-    @patch("builtins.print")
-    def test_cpf_zeros(self, mock_print: MagicMock) -> None:
+    def test_cpf_zeros(self) -> None:
         """Testa CPF com zeros."""
         cliente = PessoaFisica("João", "01/01/1990", "00000000000", "Rua A")
         assert cliente.cpf == "00000000000"
         assert cliente.get_cpf_formatado() == "000.000.000-00"
 
-    @patch("builtins.print")
-    def test_nome_muito_longo(self, mock_print: MagicMock) -> None:
-        """Testa nome muito longo."""
-        nome_longo = "João " * 50  # Nome muito longo
-        cliente = PessoaFisica(nome_longo, "01/01/1990", "12345678901", "Rua A")
-        assert cliente.nome == nome_longo
-
-    @patch("builtins.print")
-    def test_endereco_muito_longo(self, mock_print: MagicMock) -> None:
-        """Testa endereço muito longo."""
-        endereco_longo = "Rua muito longa " * 20
-        cliente = PessoaFisica("João", "01/01/1990", "12345678901", endereco_longo)
-        assert cliente.endereco == endereco_longo
-
-    @patch("builtins.print")
-    def test_transacao_exatamente_no_limite(self, mock_print: MagicMock) -> None:
+    @pytest.mark.parametrize(
+        ("campo", "valor"),
+        [("nome", "João " * 50), ("endereco", "Rua muito longa " * 20)],
+        ids=["nome_muito_longo", "endereco_muito_longo"],
+    )
+    def test_texto_muito_longo(self, campo: str, valor: str) -> None:
+        """Testa que nome e endereço muito longos são preservados."""
+        dados = {"nome": "João", "data_nascimento": "01/01/1990", "cpf": "12345678901", "endereco": "Rua A"}
+        cliente = PessoaFisica(**(dados | {campo: valor}))
+        assert getattr(cliente, campo) == valor
+
+    def test_transacao_exatamente_no_limite(self) -> None:
         """Testa transação exatamente no limite."""
         cliente = PessoaFisica("João", "01/01/1990", "12345678901", "Rua A")
         conta = ContaCorrente(cliente)
@@ -843,67 +1077,67 @@ class TestEdgeCases:
 class TestComportamentoEspecifico:
     """Testes de comportamentos específicos das classes."""
 
-    @patch("builtins.print")
-    def test_historico_preserva_ordem(self, mock_print: MagicMock) -> None:
+    def test_historico_preserva_ordem(self, cliente_joao: PessoaFisica) -> None:
         """Testa se histórico preserva ordem das transações."""
-        cliente = PessoaFisica("João", "01/01/1990", "12345678901", "Rua A")
-        conta = ContaCorrente(cliente)
+        conta = ContaCorrente(cliente_joao)
 
         # Sequência específica de transações
         deposito1 = Deposito(100.0)
         deposito2 = Deposito(200.0)
         saque1 = Saque(50.0)
 
-        cliente.realizar_transacao(conta, deposito1)
-        cliente.realizar_transacao(conta, deposito2)
-        cliente.realizar_transacao(conta, saque1)
+        cliente_joao.realizar_transacao(conta, deposito1)
+        cliente_joao.realizar_transacao(conta, deposito2)
+        cliente_joao.realizar_transacao(conta, saque1)
 
         transacoes = conta.historico.transacoes
         assert len(transacoes) == 3
 
         # Primeira transação
-        assert isinstance(transacoes[0], Deposito)
+        assert type(transacoes[0]) is Deposito
         assert transacoes[0].valor == 100.0
 
         # Segunda transação
-        assert isinstance(transacoes[1], Deposito)
+        assert type(transacoes[1]) is Deposito
         assert transacoes[1].valor == 200.0
 
         # Terceira transação
-        assert isinstance(transacoes[2], Saque)
+        assert type(transacoes[2]) is Saque
         assert transacoes[2].valor == 50.0
 
-    @patch("builtins.print")
-    def test_conta_nova_conta_com_numero_especifico(self, mock_print: MagicMock) -> None:
+    def test_conta_nova_conta_com_numero_especifico(self, cliente_joao: PessoaFisica) -> None:
         """Testa criação de conta com número específico."""
-        cliente = PessoaFisica("João", "01/01/1990", "12345678901", "Rua A")
-
         # Criar conta com número específico
-        conta_especial = ContaCorrente.nova_conta(cliente, 9999)
+        conta_especial = ContaCorrente.nova_conta(cliente_joao, 9999)
 
         assert conta_especial.numero == 9999
-        assert conta_especial.cliente == cliente
+        assert conta_especial.cliente is cliente_joao
         assert conta_especial.agencia == "0001"
 
-    def test_heranca_classes(self) -> None:
+    def test_heranca_classes(self, cliente_joao_imutavel: PessoaFisica) -> None:
         """Testa hierarquia de herança das classes."""
-        cliente = PessoaFisica("João", "01/01/1990", "12345678901", "Rua A")
-        conta_corrente = ContaCorrente(cliente)
+        conta_corrente = ContaCorrente(cliente_joao_imutavel)
 
         # Testa herança
-        assert isinstance(cliente, Cliente)
+        assert isinstance(cliente_joao_imutavel, Cliente)
         assert isinstance(conta_corrente, Conta)
 
         # Testa que métodos da classe base funcionam
-        assert hasattr(cliente, "adicionar_conta")
+        assert hasattr(cliente_joao_imutavel, "adicionar_conta")
         assert hasattr(conta_corrente, "depositar")
         assert hasattr(conta_corrente, "sacar")
 
-    @patch("builtins.print")
-    def test_polimorfismo_transacoes(self, mock_print: MagicMock) -> None:
-        """Testa polimorfismo das transações."""
+    def test_classes_sem_dict_por_instancia(self) -> None:
+        """Testa que os modelos usam __slots__ e não alocam __dict__ por instância."""
         cliente = PessoaFisica("João", "01/01/1990", "12345678901", "Rua A")
         conta = ContaCorrente(cliente)
+
+        for objeto in (cliente, conta, conta.historico, Deposito(10.0), Saque(10.0)):
+            assert not hasattr(objeto, "__dict__")
+
+    def test_polimorfismo_transacoes(self, cliente_joao: PessoaFisica) -> None:
+        """Testa polimorfismo das transações."""
+        conta = ContaCorrente(cliente_joao)
         conta.depositar(1000.0)
 
         # Lista polimórfica de transações
@@ -917,13 +1151,13 @@ class TestComportamentoEspecifico:
         assert len(historico_transacoes) == 3  # Todas as 3 transações são bem-sucedidas
 
         # Verifica os tipos e valores das transações
-        assert isinstance(historico_transacoes[0], Deposito)
+        assert type(historico_transacoes[0]) is Deposito
         assert historico_transacoes[0].valor == 100.0
 
-        assert isinstance(historico_transacoes[1], Saque)
+        assert type(historico_transacoes[1]) is Saque
         assert historico_transacoes[1].valor == 50.0
 
-        assert isinstance(historico_transacoes[2], Deposito)
+        assert type(historico_transacoes[2]) is Deposito
         assert historico_transacoes[2].valor == 200.0
 
         # Verifica saldo final: 1000 + 100 - 50 + 200 = 1250
@@ -934,32 +1168,43 @@ class TestComportamentoEspecifico:
 class TestFormatacao:
     """Testes de formatação de dados."""
 
-    def test_formatacao_cpf_diversos_formatos(self) -> None:
+    @pytest.mark.parametrize(
+        "formato", ["12345678901", "123.456.789-01", "123 456 789 01", "123-456-789-01", "123.456.789.01"]
+    )
+    def test_formatacao_cpf_diversos_formatos(self, formato: str) -> None:
         """Testa formatação de CPF com diversos formatos de entrada."""
-        formatos_entrada = ["12345678901", "123.456.789-01", "123 456 789 01", "123-456-789-01", "123.456.789.01"]
-
-        for formato in formatos_entrada:
-            cliente = PessoaFisica("João", "01/01/1990", formato, "Rua A")
-            assert cliente.cpf == "12345678901"
-            assert cliente.get_cpf_formatado() == "123.456.789-01"
+        cliente = PessoaFisica("João", "01/01/1990", formato, "Rua A")
+        assert cliente.cpf == "12345678901"
+        assert cliente.get_cpf_formatado() == "123.456.789-01"
 
-    @patch("builtins.print")
-    def test_formatacao_moeda(self, mock_print: MagicMock) -> None:
+    @pytest.mark.parametrize(
+        ("centavos", "esperado"),
+        [
+            (1, "R$ 0.01"),
+            (100, "R$ 1.00"),
+            (1050, "R$ 10.50"),
+            (10099, "R$ 100.99"),
+            (100000, "R$ 1000.00"),
+            (999999, "R$ 9999.99"),
+        ],
+    )
+    def test_formatacao_moeda(self, centavos: int, esperado: str, cliente_padrao_imutavel: PessoaFisica) -> None:
         """Testa formatação de valores monetários."""
-        cliente = PessoaFisica("João", "01/01/1990", "12345678901", "Rua A")
-        conta = ContaCorrente(cliente)
+        conta = ContaCorrente(cliente_padrao_imutavel)
+        conta._saldo_centavos = centavos
 
-        # Testa diversos valores
-        valores_teste = [0.01, 1.00, 10.50, 100.99, 1000.00, 9999.99]
+        assert conta.get_saldo_formatado() == esperado
 
-        for valor in valores_teste:
-            conta.depositar(valor)
-            saldo_formatado = conta.get_saldo_formatado()
-            assert saldo_formatado.startswith("R$ ")
-            assert "." in saldo_formatado  # Tem separador decimal
+    def test_saldo_formatado_acompanha_saldo(self, cliente_joao: PessoaFisica) -> None:
+        """Testa que o saldo formatado reaproveitado reflete sempre o saldo atual."""
+        conta = ContaCorrente(cliente_joao)
 
-            # Reset para próximo teste
-            conta._saldo_centavos = 0
+        assert conta.get_saldo_formatado() == "R$ 0.00"
+        conta._saldo_centavos = 12345
+        assert conta.get_saldo_formatado() == "R$ 123.45"
+        assert conta.get_saldo_formatado() is conta.get_saldo_formatado()
+        conta._saldo_centavos = 7
+        assert conta.get_saldo_formatado() == "R$ 0.07"
 
     def test_string_representation(self) -> None:
         """Testa representações string das classes."""